@@ -7,14 +7,17 @@ from .config import Config
 from app.routes.auth import auth_bp
 from app.routes.enterprise import enterprise_bp
 from app.routes.dca import dca_bp
+from app.commands import register_commands
 
 load_dotenv()
 
 migrate = Migrate()
 
-def create_app():
+def create_app(config=None):
     app = Flask(__name__)
     app.config.from_object(Config)
+    if config:
+        app.config.update(config)
 
     # Enable CORS (session-based)
     CORS(app, supports_credentials=True)
@@ -28,4 +31,7 @@ def create_app():
     app.register_blueprint(auth_bp, url_prefix="/api/auth")
     app.register_blueprint(enterprise_bp, url_prefix="/api/enterprise")
 
+    # CLI commands (flask <command>)
+    register_commands(app)
+
     return app
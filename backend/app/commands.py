@@ -0,0 +1,168 @@
+from datetime import datetime
+import time
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from app import db
+from app.models.audit_log import AuditLog
+from app.models.debt import DebtCase
+from app.models.recovery_rate import GLOBAL_SCOPE
+from app.services.ai_prediction_service import MODEL_VERSION
+from app.services.recovery_rate_service import rebuild_recovery_aggregates
+from app.services.case_counter_service import reconcile_status_counts
+from app.services.case_export_service import EXPORT_BATCH_SIZE, EXPORT_FORMATS, write_export
+from app.jobs.rescore import rescore_cases
+from app.jobs.aging_refresh import refresh_aging
+from app.jobs.sla_breach_checker import check_sla_thresholds, watch_sla_breaches
+from app.jobs.sla_daemon import run_sla_daemon
+
+
+@click.command("rebuild-recovery-rates")
+@click.option("--dry-run", is_flag=True, help="Only report drift, keep the stored aggregates.")
+@with_appcontext
+def rebuild_recovery_rates_command(dry_run):
+    """Recompute recovery rate aggregates from case_closures."""
+    drift = rebuild_recovery_aggregates(dry_run=dry_run)
+
+    for enterprise_id, (stored, recomputed) in sorted(drift.items()):
+        scope = "global" if enterprise_id == GLOBAL_SCOPE else f"enterprise {enterprise_id}"
+        click.echo(f"{scope}: stored={stored} recomputed={recomputed}")
+
+    click.echo(f"{len(drift)} aggregate(s) drifted" + ("" if dry_run else ", rebuilt"))
+
+
+@click.command("rescore")
+@click.option("--enterprise", type=int, help="Only rescore this enterprise's cases.")
+@click.option("--since", type=click.DateTime(formats=["%Y-%m-%d"]), help="Only cases created on or after this date.")
+@click.option("--dry-run", is_flag=True, help="Score without writing predictions.")
+@click.option("--partition-by", type=click.Choice(["enterprise", "range"]), default="enterprise", show_default=True)
+@click.option("--partition-size", type=int, default=50000, show_default=True, help="Cases per id range partition.")
+@click.option("--workers", type=int, help="Worker processes (default: CPU count).")
+@click.option("--model-version", help="Version written to ai_model_predictions (default: timestamped).")
+@with_appcontext
+def rescore_command(enterprise, since, dry_run, partition_by, partition_size, workers, model_version):
+    """Rescore every open DebtCase with the current model."""
+    stats = rescore_cases(
+        model_version or f"{MODEL_VERSION}+rescore.{datetime.utcnow():%Y%m%dT%H%M%S}",
+        by=partition_by,
+        enterprise_id=enterprise,
+        since=since,
+        dry_run=dry_run,
+        workers=workers,
+        partition_size=partition_size
+    )
+
+    if not dry_run:
+        db.session.add(AuditLog(
+            entity_type="AIModelPrediction",
+            action="RESCORE",
+            performed_at=datetime.utcnow(),
+            audit_metadata=stats
+        ))
+        db.session.commit()
+
+    click.echo(
+        f"{'Scored (dry run)' if dry_run else 'Rescored'} {stats['cases']} case(s) "
+        f"in {stats['partitions']} partition(s) with {stats['workers']} worker(s): "
+        f"{stats['elapsed_seconds']}s, {stats['cases_per_second']} cases/s, "
+        f"model_version={stats['model_version']}"
+    )
+
+
+@click.command("refresh-aging")
+@click.option("--rescore", is_flag=True, help="Rescore cases whose aging bucket changed.")
+@click.option("--all-days", is_flag=True, help="Also refresh aging_days of cases that stay in their bucket.")
+@with_appcontext
+def refresh_aging_command(rescore, all_days):
+    """Recompute aging of open cases (run daily, e.g. from cron)."""
+    bucket_changes, day_changes, rescored = refresh_aging(rescore=rescore, all_days=all_days)
+
+    click.echo(
+        f"{bucket_changes} case(s) changed aging bucket, "
+        f"{day_changes} more aging_days refreshed, {rescored} rescored"
+    )
+
+
+@click.command("reconcile-status-counts")
+@click.option("--dry-run", is_flag=True, help="Only report drift, keep the stored counters.")
+@with_appcontext
+def reconcile_status_counts_command(dry_run):
+    """Check case_status_counts against debt_cases and repair drift."""
+    drift = reconcile_status_counts(dry_run=dry_run)
+
+    for (enterprise_id, status), (stored, actual) in sorted(drift.items()):
+        click.echo(f"enterprise {enterprise_id} {status or '(none)'}: stored={stored} actual={actual}")
+
+    click.echo(f"{len(drift)} counter(s) drifted" + ("" if dry_run or not drift else ", repaired"))
+
+
+@click.command("export-cases")
+@click.option("--enterprise", type=int, required=True, help="Enterprise whose cases are exported.")
+@click.option("--format", "fmt", type=click.Choice(EXPORT_FORMATS), default="csv", show_default=True)
+@click.option("--status", multiple=True, help="Only cases with this status (repeatable).")
+@click.option("--batch-size", type=int, default=EXPORT_BATCH_SIZE, show_default=True, help="Rows fetched and written per batch.")
+@click.argument("output", type=click.Path(dir_okay=False, writable=True))
+@with_appcontext
+def export_cases_command(enterprise, fmt, status, batch_size, output):
+    """Export an enterprise's cases with predictions and closures to OUTPUT."""
+    filters = [DebtCase.enterprise_id == enterprise]
+    if status:
+        filters.append(DebtCase.status.in_(status))
+
+    started = time.perf_counter()
+    try:
+        rows = write_export(output, fmt, filters, batch_size)
+    except ValueError as exc:
+        raise click.ClickException(str(exc))
+
+    click.echo(f"Exported {rows} case(s) to {output} in {time.perf_counter() - started:.3f}s")
+
+
+@click.command("check-sla-breaches")
+@click.option("--watch", is_flag=True, help="Keep running, waking up at each next SLA deadline.")
+@click.option("--max-interval", type=float, default=None, help="Longest sleep between checks, in seconds (default SLA_CHECK_MAX_INTERVAL).")
+@with_appcontext
+def check_sla_breaches_command(watch, max_interval):
+    """Mark running SLAs past their deadline as BREACHED and warn about
+    those past their escalation threshold."""
+    if not watch:
+        breached, warned = check_sla_thresholds()
+        click.echo(f"{breached} SLA(s) breached, {warned} approaching breach")
+        return
+
+    max_interval = max_interval or current_app.config["SLA_CHECK_MAX_INTERVAL"]
+    watch_sla_breaches(
+        max_interval,
+        on_check=lambda breached, warned, delay: click.echo(
+            f"{datetime.utcnow():%Y-%m-%d %H:%M:%S} {breached} SLA(s) breached, "
+            f"{warned} approaching breach, next check in {delay:.1f}s"
+        )
+    )
+
+
+@click.command("sla-daemon")
+@click.option("--horizon", type=float, default=None, help="Seconds of upcoming deadlines held in memory (default SLA_DAEMON_HORIZON).")
+@click.option("--capacity", type=int, default=None, help="Most timers held in memory (default SLA_DAEMON_CAPACITY).")
+@with_appcontext
+def sla_daemon_command(horizon, capacity):
+    """Breach and warn about SLAs as their deadlines pass, listening for new SLAs."""
+    horizon = horizon or current_app.config["SLA_DAEMON_HORIZON"]
+    capacity = capacity or current_app.config["SLA_DAEMON_CAPACITY"]
+    click.echo(f"SLA daemon: {horizon:.0f}s horizon, up to {capacity} timers")
+
+    run_sla_daemon(
+        horizon, capacity,
+        on_check=lambda breached, warned, at: click.echo(
+            f"{at:%Y-%m-%d %H:%M:%S} {breached} SLA(s) breached, {warned} approaching breach"
+        )
+    )
+
+
+def register_commands(app):
+    app.cli.add_command(rebuild_recovery_rates_command)
+    app.cli.add_command(rescore_command)
+    app.cli.add_command(refresh_aging_command)
+    app.cli.add_command(reconcile_status_counts_command)
+    app.cli.add_command(export_cases_command)
+    app.cli.add_command(check_sla_breaches_command)
+    app.cli.add_command(sla_daemon_command)
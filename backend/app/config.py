@@ -10,7 +10,35 @@ class Config:
     # Database Settings
     SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    
+
+    # Case upload settings
+    UPLOAD_CHUNK_SIZE = int(os.environ.get("UPLOAD_CHUNK_SIZE", 50000))
+    # Largest ?chunk_size= an upload may ask for, larger values are capped
+    MAX_UPLOAD_CHUNK_SIZE = int(os.environ.get("MAX_UPLOAD_CHUNK_SIZE", 500000))
+    UPLOAD_FOLDER = os.path.abspath(os.environ.get("UPLOAD_FOLDER", "uploads"))
+    UPLOAD_WORKERS = int(os.environ.get("UPLOAD_WORKERS", 2))
+    # Seconds without progress after which a QUEUED/RUNNING upload can be resumed
+    UPLOAD_STALE_AFTER = int(os.environ.get("UPLOAD_STALE_AFTER", 900))
+
+    # Seconds an enterprise overview is served from cache
+    OVERVIEW_CACHE_TTL = float(os.environ.get("OVERVIEW_CACHE_TTL", 30))
+
+    # Analytics chart rendering
+    CHART_CACHE_SIZE = int(os.environ.get("CHART_CACHE_SIZE", 256))
+    CHART_RENDER_WORKERS = int(os.environ.get("CHART_RENDER_WORKERS", 2))
+
+    # Longest sleep of `flask check-sla-breaches --watch`, in seconds
+    SLA_CHECK_MAX_INTERVAL = float(os.environ.get("SLA_CHECK_MAX_INTERVAL", 60))
+
+    # SLA daemon (`flask sla-daemon`): seconds of deadlines and max timers held in memory
+    SLA_DAEMON_HORIZON = float(os.environ.get("SLA_DAEMON_HORIZON", 900))
+    SLA_DAEMON_CAPACITY = int(os.environ.get("SLA_DAEMON_CAPACITY", 100000))
+    # Run the daemon in a thread of the web server instead (run.py / wsgi.py,
+    # single-process setups); CLI commands and worker processes never start it
+    SLA_DAEMON_IN_PROCESS = os.environ.get("SLA_DAEMON_IN_PROCESS", "").lower() in ("1", "true", "yes")
+
+    # Case export settings
+    EXPORT_FOLDER = os.path.abspath(os.environ.get("EXPORT_FOLDER", "exports"))
     
     # Redirects after login/logout
     SECURITY_POST_LOGIN_VIEW = "/dashboard"
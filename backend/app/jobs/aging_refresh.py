@@ -0,0 +1,76 @@
+from datetime import date
+from sqlalchemy import case, cast, update
+from app import db
+from app.models.debt import DebtCase, CLOSED_STATUSES
+from app.services.ai_prediction_service import generate_predictions, ID_BATCH_SIZE
+from app.services.case_ingest_service import AGING_BINS, AGING_LABELS
+from app.utils.sql import days_since
+
+
+def aging_bucket_expression(aging_days):
+    """SQL CASE with the same buckets as ``compute_aging``."""
+    return cast(
+        case(
+            *[
+                (aging_days <= upper, label)
+                for upper, label in zip(AGING_BINS[1:-1], AGING_LABELS)
+            ],
+            else_=AGING_LABELS[-1]
+        ),
+        DebtCase.__table__.c.aging_bucket.type
+    )
+
+
+def refresh_aging(today=None, rescore=False, all_days=False):
+    """Bring ``aging_days``/``aging_bucket`` of open cases up to ``today``.
+
+    One UPDATE rewrites the rows whose bucket changed and returns their
+    ids; rows that stay in their bucket are not touched unless
+    ``all_days`` asks for a second UPDATE of the day counts. With
+    ``rescore`` the moved cases get new predictions.
+
+    Returns ``(bucket_changes, day_changes, rescored)``.
+    """
+    today = today or date.today()
+    aging_days = days_since(today, DebtCase.due_date)
+    aging_bucket = aging_bucket_expression(aging_days)
+
+    open_cases = (
+        DebtCase.status.notin_(CLOSED_STATUSES),
+        DebtCase.due_date.isnot(None)
+    )
+
+    moved_ids = db.session.scalars(
+        update(DebtCase)
+        .where(*open_cases, DebtCase.aging_bucket.is_distinct_from(aging_bucket))
+        .values(aging_days=aging_days, aging_bucket=aging_bucket)
+        .returning(DebtCase.id)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    day_changes = 0
+    if all_days:
+        day_changes = db.session.execute(
+            update(DebtCase)
+            .where(*open_cases, DebtCase.aging_days.is_distinct_from(aging_days))
+            .values(aging_days=aging_days)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+    db.session.commit()
+
+    rescored = 0
+    if rescore:
+        for start in range(0, len(moved_ids), ID_BATCH_SIZE):
+            rescored += generate_predictions(
+                db.session.execute(
+                    db.select(
+                        DebtCase.id,
+                        DebtCase.enterprise_id,
+                        DebtCase.aging_bucket,
+                        DebtCase.amount_due
+                    ).where(DebtCase.id.in_(moved_ids[start:start + ID_BATCH_SIZE]))
+                ).all()
+            )
+
+    return len(moved_ids), day_changes, rescored
@@ -0,0 +1,153 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from flask import current_app
+from sqlalchemy import func
+from app import db
+from app.models.debt import DebtCase, CLOSED_STATUSES
+from app.services.ai_prediction_service import predict_batch, generate_predictions
+
+# Cases scored and committed together inside a partition
+BATCH_SIZE = 5000
+
+# App of a pool worker process, created once by _init_worker
+_worker_app = None
+
+
+def _open_case_filters(enterprise_id=None, since=None):
+    filters = [DebtCase.status.notin_(CLOSED_STATUSES)]
+    if enterprise_id is not None:
+        filters.append(DebtCase.enterprise_id == enterprise_id)
+    if since is not None:
+        filters.append(DebtCase.created_at >= since)
+    return filters
+
+
+def _partition_filters(partition):
+    kind, *bounds = partition
+    if kind == "enterprise":
+        enterprise_id, = bounds
+        if enterprise_id is None:
+            return [DebtCase.enterprise_id.is_(None)]
+        return [DebtCase.enterprise_id == enterprise_id]
+
+    low, high = bounds
+    return [DebtCase.id.between(low, high)]
+
+
+def plan_partitions(by="enterprise", enterprise_id=None, since=None, partition_size=50000):
+    """Split the open portfolio into ``("enterprise", id)`` or
+    ``("range", low_id, high_id)`` partitions."""
+    filters = _open_case_filters(enterprise_id, since)
+
+    if by == "enterprise":
+        enterprise_ids = db.session.scalars(
+            db.select(DebtCase.enterprise_id).where(*filters).distinct()
+        )
+        return [("enterprise", e) for e in enterprise_ids]
+
+    low, high = db.session.execute(
+        db.select(func.min(DebtCase.id), func.max(DebtCase.id)).where(*filters)
+    ).one()
+    if low is None:
+        return []
+
+    return [
+        ("range", start, min(start + partition_size - 1, high))
+        for start in range(low, high + 1, partition_size)
+    ]
+
+
+def rescore_partition(partition, enterprise_id, since, model_version, dry_run):
+    """Rescore the open cases of one partition, ``BATCH_SIZE`` at a time.
+
+    Walks the partition by id so every batch is an index range scan, and
+    commits after each batch unless ``dry_run``. Returns the case count.
+    """
+    filters = _open_case_filters(enterprise_id, since) + _partition_filters(partition)
+
+    rescored = 0
+    last_id = 0
+    while True:
+        cases = db.session.execute(
+            db.select(
+                DebtCase.id,
+                DebtCase.enterprise_id,
+                DebtCase.aging_bucket,
+                DebtCase.amount_due
+            )
+            .where(*filters, DebtCase.id > last_id)
+            .order_by(DebtCase.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not cases:
+            break
+
+        if dry_run:
+            predict_batch(cases, model_version)
+        else:
+            generate_predictions(cases, model_version)
+
+        rescored += len(cases)
+        last_id = cases[-1].id
+
+    return rescored
+
+
+def _init_worker(config):
+    # every worker process gets its own app, engine and DB connection
+    global _worker_app
+    from app import create_app
+    _worker_app = create_app(config)
+
+
+def _rescore_in_worker(*args):
+    with _worker_app.app_context():
+        return rescore_partition(*args)
+
+
+def rescore_cases(model_version, by="enterprise", enterprise_id=None, since=None,
+                  dry_run=False, workers=None, partition_size=50000):
+    """Rescore every open case, fanning the partitions out to a process pool.
+
+    With one worker (or one partition) everything runs in this process.
+    Returns run statistics for the CLI and the audit log.
+    """
+    partitions = plan_partitions(by, enterprise_id, since, partition_size)
+    workers = min(workers or multiprocessing.cpu_count(), len(partitions)) or 1
+
+    started = time.perf_counter()
+
+    args = (
+        partitions,
+        repeat(enterprise_id),
+        repeat(since),
+        repeat(model_version),
+        repeat(dry_run)
+    )
+
+    if workers == 1:
+        counts = list(map(rescore_partition, *args))
+    else:
+        config = {"SQLALCHEMY_DATABASE_URI": current_app.config["SQLALCHEMY_DATABASE_URI"]}
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(config,)
+        ) as pool:
+            counts = list(pool.map(_rescore_in_worker, *args))
+
+    elapsed = time.perf_counter() - started
+    rescored = sum(counts)
+
+    return {
+        "model_version": model_version,
+        "partitions": len(partitions),
+        "workers": workers,
+        "cases": rescored,
+        "dry_run": dry_run,
+        "elapsed_seconds": round(elapsed, 3),
+        "cases_per_second": round(rescored / elapsed, 1) if elapsed else None
+    }
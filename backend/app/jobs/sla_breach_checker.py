@@ -1,33 +1,136 @@
-from datetime import datetime, timedelta
+from datetime import datetime
+import time
+from sqlalchemy import insert, update
 from app import db
-from app.models.sla import CaseSLATracking
+from app.models.sla import CaseSLATracking, SLADefinition
 from app.models.audit_log import AuditLog
+from app.services.sla_service import next_sla_deadline
 
-def check_sla_breaches():
-    now = datetime.utcnow()
-
-    running_slas = CaseSLATracking.query.filter_by(status="RUNNING").all()
-
-    for sla in running_slas:
-        max_hours = sla.sla_definition.max_resolution_hours
-        deadline = sla.started_at + timedelta(hours=max_hours)
-
-        if now > deadline:
-            sla.status = "BREACHED"
-            sla.breached_at = now
-            db.session.add(sla)
-
-            # ✅ Audit log for FedEx compliance
-            db.session.add(AuditLog(
-                entity_type="SLA",
-                entity_id=str(sla.case_id),
-                action="SLA_BREACHED",
-                performed_at=now,
-                audit_metadata={
-                    "sla_definition_id": sla.sla_definition_id,
-                    "max_resolution_hours": max_hours
+def check_sla_breaches(now=None):
+    """Mark every RUNNING SLA past its ``due_at`` as BREACHED and audit it.
+
+    One ``UPDATE ... RETURNING`` flips the rows, reading only the overdue
+    end of the partial ``due_at`` index, and one bulk INSERT writes their
+    audit entries. The ``status = 'RUNNING'`` condition is re-checked under
+    the row lock, so when two checkers run at once each breach is claimed,
+    and audited, by exactly one of them.
+
+    Returns the number of SLAs breached.
+    """
+    now = now or datetime.utcnow()
+
+    breached = db.session.execute(
+        update(CaseSLATracking)
+        .where(
+            CaseSLATracking.status == "RUNNING",
+            CaseSLATracking.due_at < now
+        )
+        .values(status="BREACHED", breached_at=now)
+        .returning(CaseSLATracking.case_id, CaseSLATracking.sla_definition_id)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    if breached:
+        max_hours = dict(
+            db.session.execute(
+                db.select(SLADefinition.id, SLADefinition.max_resolution_hours)
+                .where(SLADefinition.id.in_({s.sla_definition_id for s in breached}))
+            ).all()
+        )
+
+        # ✅ Audit log for FedEx compliance
+        db.session.execute(insert(AuditLog), [
+            {
+                "entity_type": "SLA",
+                "entity_id": str(s.case_id),
+                "action": "SLA_BREACHED",
+                "performed_at": now,
+                "audit_metadata": {
+                    "sla_definition_id": s.sla_definition_id,
+                    "max_resolution_hours": max_hours[s.sla_definition_id]
+                }
+            }
+            for s in breached
+        ])
+
+    db.session.commit()
+    return len(breached)
+
+
+def check_sla_warnings(now=None):
+    """Flag every RUNNING SLA past its escalation threshold (``warn_at``)
+    and audit it as ``SLA_APPROACHING_BREACH``, once per SLA.
+
+    Same shape as ``check_sla_breaches``: one ``UPDATE ... RETURNING`` over
+    the partial index of unwarned running SLAs, then one bulk INSERT. Run
+    it after the breach check, so SLAs already past their deadline are
+    reported as breached only.
+
+    Returns the number of SLAs warned about.
+    """
+    now = now or datetime.utcnow()
+
+    warned = db.session.execute(
+        update(CaseSLATracking)
+        .where(
+            CaseSLATracking.status == "RUNNING",
+            CaseSLATracking.warned_at.is_(None),
+            CaseSLATracking.warn_at <= now
+        )
+        .values(warned_at=now)
+        .returning(CaseSLATracking.case_id, CaseSLATracking.sla_definition_id, CaseSLATracking.due_at)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    if warned:
+        db.session.execute(insert(AuditLog), [
+            {
+                "entity_type": "SLA",
+                "entity_id": str(s.case_id),
+                "action": "SLA_APPROACHING_BREACH",
+                "performed_at": now,
+                "audit_metadata": {
+                    "sla_definition_id": s.sla_definition_id,
+                    "due_at": s.due_at.isoformat() if s.due_at else None,
+                    "hours_remaining": round((s.due_at - now).total_seconds() / 3600, 2) if s.due_at else None
                 }
-            ))
+            }
+            for s in warned
+        ])
 
     db.session.commit()
+    return len(warned)
+
+
+def check_sla_thresholds(now=None):
+    """Breach check then warning check at the same ``now``.
+
+    Returns ``(breached, warned)``.
+    """
+    now = now or datetime.utcnow()
+    return check_sla_breaches(now), check_sla_warnings(now)
+
+
+def seconds_until_next_deadline(max_interval, now=None):
+    """Seconds to sleep before the next check, at most ``max_interval``.
+
+    SLAs started meanwhile may be due sooner than the current next deadline,
+    ``max_interval`` bounds how late those are picked up.
+    """
+    deadline = next_sla_deadline()
+    if deadline is None:
+        return max_interval
+
+    now = now or datetime.utcnow()
+    return min(max(0.0, (deadline - now).total_seconds()), max_interval)
+
 
+def watch_sla_breaches(max_interval, on_check=None):
+    """Check for breaches and warnings, then sleep until the next deadline
+    or threshold, forever."""
+    while True:
+        breached, warned = check_sla_thresholds()
+        delay = seconds_until_next_deadline(max_interval)
+        if on_check:
+            on_check(breached, warned, delay)
+        time.sleep(delay)
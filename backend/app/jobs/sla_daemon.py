@@ -0,0 +1,213 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import heapq
+import json
+import queue
+import select
+import threading
+from app import db
+from app.jobs.sla_breach_checker import check_sla_thresholds
+from app.services.sla_service import (
+    SLA_EVENTS_CHANNEL,
+    local_sla_events,
+    upcoming_sla_deadlines,
+    upcoming_sla_warnings
+)
+
+# Timer kinds: the breach deadline (due_at) and the escalation threshold (warn_at)
+DUE = "due"
+WARN = "warn"
+
+
+class DeadlineHeap:
+    """Min-heap of the running SLA timers due before ``loaded_until``,
+    keyed by ``(kind, case_id)``.
+
+    Holds at most ``capacity`` live timers: deadlines further out stay in
+    case_sla_tracking and are loaded when the window moves on. Completed
+    or restarted SLAs are removed lazily, their stale entries are skipped
+    when popped and compacted away once they outnumber the live ones.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.loaded_until = datetime.min
+        self._heap = []
+        # (kind, case_id) -> due time of its live timer
+        self._due = {}
+
+    def __len__(self):
+        return len(self._due)
+
+    def load(self, timers, until):
+        """Replace the timers with ``timers``, ``(key, due)`` of every timer
+        due before ``until``; past ``capacity`` only the soonest are kept."""
+        timers = sorted(timers, key=lambda timer: timer[1])
+        if len(timers) > self.capacity:
+            timers = timers[:self.capacity]
+            until = timers[-1][1]
+        self._due = dict(timers)
+        self._compact()
+        self.loaded_until = until
+
+    def push(self, key, due):
+        if due >= self.loaded_until:
+            return  # loaded with the next window
+        if len(self._due) >= self.capacity and key not in self._due:
+            # full: shrink the window, later timers come with the next load
+            self.loaded_until = due
+            return
+        self._due[key] = due
+        heapq.heappush(self._heap, (due, key))
+        if len(self._heap) > 2 * self.capacity:
+            self._compact()
+
+    def discard(self, key):
+        self._due.pop(key, None)
+
+    def next_due(self):
+        """Earliest live timer, ``None`` when there is none."""
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now):
+        """Remove the timers due by ``now``, returns how many there were."""
+        popped = 0
+        while self._heap and self._heap[0][0] <= now:
+            due, key = heapq.heappop(self._heap)
+            if self._due.get(key) == due:
+                del self._due[key]
+                popped += 1
+        return popped
+
+    def _compact(self):
+        self._heap = [(due, key) for key, due in self._due.items()]
+        heapq.heapify(self._heap)
+
+
+@contextmanager
+def sla_event_listener():
+    """``wait(timeout)`` returning the SLA event payloads published since the
+    last call, blocking up to ``timeout`` seconds for the first one.
+
+    LISTENs on ``SLA_EVENTS_CHANNEL`` on Postgres, reads the in-process
+    ``local_sla_events`` queue elsewhere.
+    """
+    if db.engine.dialect.name != "postgresql":
+        def wait(timeout):
+            try:
+                payloads = [local_sla_events.get(timeout=timeout)]
+            except queue.Empty:
+                return []
+            while True:
+                try:
+                    payloads.append(local_sla_events.get_nowait())
+                except queue.Empty:
+                    return payloads
+
+        yield wait
+        return
+
+    connection = db.engine.raw_connection()
+    # autocommit and LISTEN must not leak into the pool
+    connection.detach()
+    try:
+        listener = connection.driver_connection
+        listener.autocommit = True
+        listener.cursor().execute(f"LISTEN {SLA_EVENTS_CHANNEL}")
+
+        def wait(timeout):
+            if not listener.notifies:
+                select.select([listener], [], [], timeout)
+            listener.poll()
+            payloads = [n.payload for n in listener.notifies]
+            listener.notifies.clear()
+            return payloads
+
+        yield wait
+    finally:
+        connection.close()
+
+
+def apply_sla_event(timers, payload):
+    data = json.loads(payload)
+    case_id = data["case_id"]
+    if data["event"] == "started":
+        timers.push((DUE, case_id), datetime.fromisoformat(data["due_at"]))
+        if data.get("warn_at"):
+            timers.push((WARN, case_id), datetime.fromisoformat(data["warn_at"]))
+    elif data["event"] == "completed":
+        timers.discard((DUE, case_id))
+        timers.discard((WARN, case_id))
+
+
+def load_sla_timers(timers, until, capacity):
+    """Load the breach and warning timers due before ``until``.
+
+    Each kind is read from its own partial index, at most ``capacity``
+    rows; a kind that filled up bounds the window at its last row.
+    """
+    loaded = []
+    for kind, upcoming in ((DUE, upcoming_sla_deadlines), (WARN, upcoming_sla_warnings)):
+        rows = upcoming(until, capacity)
+        loaded += [((kind, case_id), due) for case_id, due in rows]
+        if len(rows) >= capacity:
+            until = min(until, rows[-1][1])
+    timers.load([timer for timer in loaded if timer[1] <= until], until)
+
+
+def run_sla_daemon(horizon, capacity, on_check=None, stop=None):
+    """Breach and warn about SLAs as their deadlines and escalation
+    thresholds pass, until ``stop`` is set.
+
+    Timers of the next ``horizon`` seconds (at most ``capacity`` of them)
+    are loaded into a ``DeadlineHeap`` and the daemon sleeps until the
+    earliest, waking early for SLAs started or completed meanwhile. The
+    checks themselves go through ``check_sla_thresholds``, so a timer gone
+    stale only costs two empty UPDATEs. Each window reload also runs the
+    checks, which covers events missed while the daemon was down.
+    """
+    timers = DeadlineHeap(capacity)
+    stop = stop or threading.Event()
+
+    with sla_event_listener() as wait:
+        while not stop.is_set():
+            now = datetime.utcnow()
+            due = 0
+            if now >= timers.loaded_until:
+                due = 1
+                load_sla_timers(timers, now + timedelta(seconds=horizon), capacity)
+            due += timers.pop_due(now)
+
+            if due:
+                breached, warned = check_sla_thresholds(now)
+                if (breached or warned) and on_check:
+                    on_check(breached, warned, now)
+            # keep no ORM state between ticks
+            db.session.remove()
+
+            wake_at = min(timers.next_due() or timers.loaded_until, timers.loaded_until)
+            timeout = max(0.0, (wake_at - datetime.utcnow()).total_seconds())
+            for payload in wait(timeout):
+                apply_sla_event(timers, payload)
+
+
+_daemon_thread = None
+_daemon_lock = threading.Lock()
+
+
+def start_sla_daemon_thread(app):
+    """Run the SLA daemon in a background thread of this process, so SLAs
+    started here reach it through ``local_sla_events``."""
+    global _daemon_thread
+
+    def run():
+        with app.app_context():
+            run_sla_daemon(app.config["SLA_DAEMON_HORIZON"], app.config["SLA_DAEMON_CAPACITY"])
+
+    with _daemon_lock:
+        if _daemon_thread is None:
+            _daemon_thread = threading.Thread(target=run, name="sla-daemon", daemon=True)
+            _daemon_thread.start()
+    return _daemon_thread
@@ -0,0 +1,43 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from app import db
+from app.models.case_upload import CaseUpload
+from app.services.case_ingest_service import run_upload
+
+_executor = None
+_executor_lock = Lock()
+
+
+def _get_executor(app):
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=app.config["UPLOAD_WORKERS"],
+                thread_name_prefix="case-upload"
+            )
+    return _executor
+
+
+def submit_upload(app, upload_id):
+    """Queue a persisted ``CaseUpload`` for processing off the request thread."""
+    return _get_executor(app).submit(process_upload, app, upload_id)
+
+
+def process_upload(app, upload_id):
+    with app.app_context():
+        upload = db.session.get(CaseUpload, upload_id)
+        if not upload or upload.status == "COMPLETED":
+            return
+
+        try:
+            run_upload(upload, upload.stored_path)
+        except Exception:
+            # the stored file is kept so the job can be resumed
+            app.logger.exception("Case upload %s failed", upload_id)
+            return
+
+        os.remove(upload.stored_path)
+        upload.stored_path = None
+        db.session.commit()
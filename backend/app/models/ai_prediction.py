@@ -1,6 +1,16 @@
 from . import db
 from datetime import datetime
 
+# (label, lower bound) of the priority_score bands, highest first. The one
+# definition used by the analytics, the summary and the DCA feed filter.
+PRIORITY_BANDS = (("High", 0.7), ("Medium", 0.4), ("Low", None))
+
+# lower-cased label -> [low, high) bounds of its band, None where open
+PRIORITY_BAND_RANGES = {
+    label.lower(): (low, PRIORITY_BANDS[i - 1][1] if i else None)
+    for i, (label, low) in enumerate(PRIORITY_BANDS)
+}
+
 class AIModelPrediction(db.Model):
     __tablename__ = "ai_model_predictions"
 
@@ -24,3 +34,14 @@ class AIModelPrediction(db.Model):
         default=datetime.utcnow,
         nullable=False
     )
+
+
+def priority_band_filters(band):
+    """Conditions on ``priority_score`` selecting one band, by lower-cased label."""
+    low, high = PRIORITY_BAND_RANGES[band]
+    filters = []
+    if low is not None:
+        filters.append(AIModelPrediction.priority_score >= low)
+    if high is not None:
+        filters.append(AIModelPrediction.priority_score < high)
+    return filters
@@ -6,7 +6,10 @@ from .case_activity import *
 from .case_assignment import *
 from .case_closure import *
 from .case_escalation import *
+from .case_status_count import *
+from .case_upload import *
 from .dca_performance import *
 from .debt import *
 from .organization import *
+from .recovery_rate import *
 from .sla import *
\ No newline at end of file
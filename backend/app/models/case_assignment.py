@@ -3,6 +3,10 @@ from datetime import datetime
 
 class CaseAssignment(db.Model):
     __tablename__ = "case_assignments"
+    __table_args__ = (
+        # a DCA's case feed
+        db.Index("ix_case_assignments_dca_id_case_id", "dca_id", "case_id"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     case_id = db.Column(db.Integer, db.ForeignKey("debt_cases.id",ondelete="CASCADE"), nullable=False)
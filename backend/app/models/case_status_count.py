@@ -0,0 +1,18 @@
+from . import db
+from datetime import datetime
+
+class CaseStatusCount(db.Model):
+    __tablename__ = "case_status_counts"
+
+    enterprise_id = db.Column(
+        db.Integer,
+        db.ForeignKey("organizations.id", ondelete="CASCADE"),
+        primary_key=True,
+        autoincrement=False
+    )
+    status = db.Column(db.String(20), primary_key=True)  # "" for cases without a status
+
+    # Number of the enterprise's debt_cases in this status
+    case_count = db.Column(db.Integer, default=0, nullable=False)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
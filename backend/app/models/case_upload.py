@@ -0,0 +1,37 @@
+from . import db
+from datetime import datetime
+
+class CaseUpload(db.Model):
+    __tablename__ = "case_uploads"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    enterprise_id = db.Column(
+        db.Integer,
+        db.ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    uploaded_by = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
+
+    filename = db.Column(db.String(255))
+    file_sha256 = db.Column(db.String(64), nullable=False)  # resume only with the same file
+    stored_path = db.Column(db.String(500))  # set for background jobs until they complete
+
+    status = db.Column(db.String(20), default="RUNNING")  # QUEUED, RUNNING, FAILED, COMPLETED
+
+    # Progress, updated in the same transaction as each chunk's rows
+    chunk_size = db.Column(db.Integer, nullable=False)
+    chunks_committed = db.Column(db.Integer, default=0, nullable=False)
+    rows_processed = db.Column(db.Integer, default=0, nullable=False)
+    rows_created = db.Column(db.Integer, default=0, nullable=False)
+    rows_skipped = db.Column(db.Integer, default=0, nullable=False)
+    rows_invalid = db.Column(db.Integer, default=0, nullable=False)
+
+    # First rows rejected by validation: [{"row": line, "errors": [...]}]
+    validation_errors = db.Column(db.JSON)
+
+    error = db.Column(db.Text)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    completed_at = db.Column(db.DateTime)
@@ -1,8 +1,29 @@
 from . import db
 from datetime import datetime
+from sqlalchemy import func, literal_column
+
+# Statuses that take a case out of the open portfolio
+CLOSED_STATUSES = ("CLOSED", "Collected")
+
+# Sort values standing in for a missing prediction / aging_days, below every real one
+NO_PRIORITY = -1.0
+NO_AGING_DAYS = -(2 ** 31)
 
 class DebtCase(db.Model):
     __tablename__ = "debt_cases"
+    __table_args__ = (
+        # keyset pagination of a tenant's cases
+        db.Index("ix_debt_cases_enterprise_id_id", "enterprise_id", "id"),
+        db.Index("ix_debt_cases_enterprise_id_amount_due", "enterprise_id", "amount_due", "id"),
+        db.Index("ix_debt_cases_enterprise_id_priority_sort", "enterprise_id", "priority_sort", "id"),
+        # same expression as the aging_days sort key, literal so planners match it
+        db.Index(
+            "ix_debt_cases_enterprise_id_aging_sort",
+            "enterprise_id",
+            db.text(f"coalesce(aging_days, {NO_AGING_DAYS})"),
+            "id"
+        ),
+    )
 
     # Primary key
     id = db.Column(db.Integer, primary_key=True)
@@ -23,6 +44,10 @@ class DebtCase(db.Model):
     aging_days = db.Column(db.Integer)
     aging_bucket = db.Column(db.Enum("0-30","31-60","61-90","90+", name="aging_bucket"))
 
+    # priority_score of the case's prediction, NO_PRIORITY until scored;
+    # copied here so the default listing sort is one index scan
+    priority_sort = db.Column(db.Float, nullable=False, default=NO_PRIORITY, server_default=str(NO_PRIORITY))
+
     # Assignment
     assigned_agent_id = db.Column(db.Integer, db.ForeignKey('users.id'))
     created_by = db.Column(db.Integer, db.ForeignKey('users.id'))
@@ -50,4 +75,14 @@ class DebtCase(db.Model):
         cascade="all, delete-orphan",
         passive_deletes=True
     )
-   
\ No newline at end of file
+
+
+# Sort keys of the case listings (?sort=), each backed by an
+# (enterprise_id, key, id) index. Missing values sort below every real one
+# so keyset comparisons never meet a NULL.
+CASE_SORT_KEYS = {
+    "priority_score": DebtCase.priority_sort,
+    "amount_due": DebtCase.amount_due,
+    # literal, to match the expression of ix_debt_cases_enterprise_id_aging_sort
+    "aging_days": func.coalesce(DebtCase.aging_days, literal_column(str(NO_AGING_DAYS)))
+}
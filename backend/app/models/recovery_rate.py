@@ -0,0 +1,19 @@
+from . import db
+from datetime import datetime
+
+# enterprise_id used for the row that aggregates every enterprise
+GLOBAL_SCOPE = 0
+
+class RecoveryRateAggregate(db.Model):
+    __tablename__ = "recovery_rate_aggregates"
+
+    # No FK: GLOBAL_SCOPE is not an organization
+    enterprise_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+
+    # Running sums over closures with a recovered amount and a non-zero amount due
+    closure_count = db.Column(db.Integer, default=0, nullable=False)
+    recovered_total = db.Column(db.Float, default=0, nullable=False)
+    due_total = db.Column(db.Float, default=0, nullable=False)
+    ratio_total = db.Column(db.Float, default=0, nullable=False)  # sum(recovered / due)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -22,5 +22,27 @@ class CaseSLATracking(db.Model):
     case_id = db.Column(db.Integer, db.ForeignKey("debt_cases.id",ondelete="CASCADE"))
     sla_definition_id = db.Column(db.Integer, db.ForeignKey("sla_definitions.id"))
     started_at = db.Column(db.DateTime)
+    # started_at + max_resolution_hours, set when the SLA starts
+    due_at = db.Column(db.DateTime)
+    # started_at + escalation_threshold_hours, when the SLA counts as at risk
+    warn_at = db.Column(db.DateTime)
+    warned_at = db.Column(db.DateTime)
     breached_at = db.Column(db.DateTime)
     status = db.Column(db.Enum("RUNNING","BREACHED","COMPLETED", name="sla_status"))
+
+    __table_args__ = (
+        # SLAs of a case, and the join from an enterprise's cases
+        db.Index("ix_case_sla_tracking_case_id_id", "case_id", "id"),
+        # breach scans only read running SLAs, soonest deadline first
+        db.Index(
+            "ix_case_sla_tracking_running_due_at", "due_at",
+            postgresql_where=db.text("status = 'RUNNING'"),
+            sqlite_where=db.text("status = 'RUNNING'")
+        ),
+        # threshold scans only read running SLAs not warned about yet
+        db.Index(
+            "ix_case_sla_tracking_unwarned_warn_at", "warn_at",
+            postgresql_where=db.text("status = 'RUNNING' AND warned_at IS NULL"),
+            sqlite_where=db.text("status = 'RUNNING' AND warned_at IS NULL")
+        ),
+    )
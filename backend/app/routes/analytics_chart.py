@@ -1,53 +1,128 @@
 import io
 import base64
+import hashlib
+import json
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+from flask import current_app
 import matplotlib
 matplotlib.use("Agg")  # ✅ NON-GUI backend
 import matplotlib.pyplot as plt
-from collections import Counter
 
-def generate_aging_chart(cases):
-    buckets = [c.aging_bucket or "Unknown" for c in cases]
-    counts = Counter(buckets)
+# Rendered charts by fingerprint, least recently used first
+_render_cache = OrderedDict()
+_render_cache_lock = Lock()
 
-    fig, ax = plt.subplots(figsize=(6, 4))
-    ax.bar(counts.keys(), counts.values(), color="#4c72b0")
+_render_pool = None
+_render_pool_lock = Lock()
+
+CHART_FORMATS = ("png", "svg")
+
+# Rendering options: pixel size and DPI, defaults match the original 6x4in @ 100dpi
+DEFAULT_DPI = 100
+DEFAULT_SIZE = (600, 400)
+DPI_RANGE = (50, 300)
+SIZE_RANGE = (200, 2000)
+
+def _figure(size, dpi):
+    width, height = size
+    return plt.subplots(figsize=(width / dpi, height / dpi), dpi=dpi)
+
+
+def generate_aging_chart(counts, fmt="png", dpi=DEFAULT_DPI, size=DEFAULT_SIZE):
+    """``counts``: ``{aging_bucket: case_count}``, see ``aging_distribution``."""
+    fig, ax = _figure(size, dpi)
+    ax.bar(list(counts.keys()), list(counts.values()), color="#4c72b0")
 
     ax.set_title("Aging Distribution")
     ax.set_xlabel("Aging Bucket (days)")
     ax.set_ylabel("Number of Cases")
 
-    return _fig_to_base64(fig)
+    return _encode_figure(fig, fmt, dpi)
 
 
-def generate_priority_chart(cases):
-    priority = {"High": 0, "Medium": 0, "Low": 0}
-
-    for c in cases:
-        if c.prediction.priority_score is None:
-            continue
-        if c.prediction.priority_score >= 0.7:
-            priority["High"] += 1
-        elif c.prediction.priority_score >= 0.4:
-            priority["Medium"] += 1
-        else:
-            priority["Low"] += 1
+def generate_priority_chart(priority, fmt="png", dpi=DEFAULT_DPI, size=DEFAULT_SIZE):
+    """``priority``: ``{band: case_count}``, see ``priority_distribution``."""
     if all(v == 0 for v in priority.values()):
-          return None      
+        return None
 
-    fig, ax = plt.subplots(figsize=(6, 4))
-    ax.bar(priority.keys(), priority.values(), color="#dd8452")
+    fig, ax = _figure(size, dpi)
+    ax.bar(list(priority.keys()), list(priority.values()), color="#dd8452")
 
     ax.set_title("AI Priority Distribution")
     ax.set_xlabel("Priority")
     ax.set_ylabel("Number of Cases")
 
-    return _fig_to_base64(fig)
+    return _encode_figure(fig, fmt, dpi)
 
 
-def _fig_to_base64(fig):
+def _encode_figure(fig, fmt, dpi):
+    """PNG as base64, SVG as markup text (fonts left as text, not paths)."""
     buf = io.BytesIO()
     fig.tight_layout()
-    fig.savefig(buf, format="png")
+    with plt.rc_context({"svg.fonttype": "none"}):
+        fig.savefig(buf, format=fmt, dpi=dpi, metadata={"Date": None} if fmt == "svg" else None)
     plt.close(fig)
     buf.seek(0)
+    if fmt == "svg":
+        return buf.read().decode("utf-8")
     return base64.b64encode(buf.read()).decode("utf-8")
+
+
+CHART_RENDERERS = {
+    "aging": generate_aging_chart,
+    "priority": generate_priority_chart
+}
+
+
+def chart_fingerprint(kind, counts, fmt="png", dpi=DEFAULT_DPI, size=DEFAULT_SIZE):
+    """Stable key of a chart: its kind, the ordered counts it plots and the
+    rendering options, so each format and size is cached on its own."""
+    payload = json.dumps([kind, list(counts.items()), fmt, dpi, list(size)])
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def _get_render_pool(workers):
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            # spawn, not fork: the web worker may be running threads
+            _render_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+    return _render_pool
+
+
+def render_chart(kind, counts, fmt="png", dpi=DEFAULT_DPI, size=DEFAULT_SIZE):
+    """``CHART_RENDERERS[kind](counts, ...)``, served from the LRU cache when
+    the same counts were rendered with the same options before.
+
+    Misses render in a process pool of ``CHART_RENDER_WORKERS`` processes,
+    so matplotlib's global state and CPU time stay off the web workers;
+    with 0 workers they render in this process.
+    """
+    key = chart_fingerprint(kind, counts, fmt, dpi, size)
+
+    with _render_cache_lock:
+        if key in _render_cache:
+            _render_cache.move_to_end(key)
+            return _render_cache[key]
+
+    workers = current_app.config["CHART_RENDER_WORKERS"]
+    if workers > 0:
+        chart = _get_render_pool(workers).submit(
+            CHART_RENDERERS[kind], dict(counts), fmt, dpi, size
+        ).result()
+    else:
+        chart = CHART_RENDERERS[kind](counts, fmt, dpi, size)
+
+    with _render_cache_lock:
+        _render_cache[key] = chart
+        _render_cache.move_to_end(key)
+        while len(_render_cache) > current_app.config["CHART_CACHE_SIZE"]:
+            _render_cache.popitem(last=False)
+
+    return chart
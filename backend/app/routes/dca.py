@@ -1,6 +1,8 @@
 from flask import Blueprint, session, jsonify, abort,request
+from sqlalchemy import func
 from app.models.case_assignment import CaseAssignment
-from app.models.debt import DebtCase
+from app.models.debt import DebtCase, CASE_SORT_KEYS
+from app.models.ai_prediction import AIModelPrediction, PRIORITY_BAND_RANGES, priority_band_filters
 from app.models.user import User
 from app.models.audit_log import AuditLog
 from datetime import datetime
@@ -9,52 +11,91 @@ from app.models.case_activity import CaseActivityLog
 from app.models.case_escalation import CaseEscalation
 from app.models.sla import CaseSLATracking
 from app.services.sla_service import sla_if_running
+from app.services.overview_service import invalidate_overview
+from app.services.case_counter_service import record_status_change
+from app.utils.pagination import page_size, keyset_page
 
 
 dca_bp = Blueprint("dca", __name__)
 
+def feed_filters(dca_id):
+    filters = [
+        CaseAssignment.dca_id == dca_id,
+        CaseAssignment.unassigned_at.is_(None)
+    ]
+
+    # statuses are stored in mixed case ("PENDING" on assignment, "Pending"
+    # from update_case_status), match them like the old client-side filter
+    status = request.args.get("status")
+    if status:
+        filters.append(func.upper(DebtCase.status) == status.upper())
+
+    band = (request.args.get("priority") or "").lower()
+    if band in PRIORITY_BAND_RANGES:
+        filters += priority_band_filters(band)
+
+    return filters
+
+
 @dca_bp.route("/cases", methods=["GET"])
 def get_assigned_cases():
     # 1. Role check
     if session.get("role") != "DCA":
         abort(403)
 
-    # 2. Logged-in user
-    user = User.query.get(session.get("user_id"))
-    if not user or not user.organization_id:
-        return jsonify([])
-
-    # 3. Active assignments for this DCA organization
-    assignments = (
-        CaseAssignment.query
-        .filter(
-            CaseAssignment.dca_id == user.organization_id,
-            CaseAssignment.unassigned_at.is_(None)
+    dca_id = session.get("organization_id")
+    if not dca_id:
+        return jsonify({"items": [], "next_cursor": None})
+
+    sort = request.args.get("sort", "priority_score")
+    order = request.args.get("order", "desc")
+    if sort not in CASE_SORT_KEYS or order not in ("asc", "desc"):
+        return jsonify({"error": "Invalid sort or order"}), 400
+
+    # 2. Active assignments joined to their cases and predictions
+    query = (
+        db.select(
+            DebtCase.id,
+            DebtCase.tracking_number,
+            DebtCase.customer_name,
+            DebtCase.amount_due,
+            DebtCase.aging_days,
+            AIModelPrediction.priority_score,
+            DebtCase.status
         )
-        .all()
+        .select_from(CaseAssignment)
+        .join(DebtCase, DebtCase.id == CaseAssignment.case_id)
+        .outerjoin(AIModelPrediction, AIModelPrediction.case_id == DebtCase.id)
+        .where(*feed_filters(dca_id))
     )
 
-    # 4. Build response
-    result = []
-    for a in assignments:
-        case = DebtCase.query.get(a.case_id)
-        if not case:
-            continue
-
-        result.append({
-            "id": case.id,
-            "case_id": case.tracking_number,
-            "customer": case.customer_name,
-            "amount": case.amount_due,
-            "aging": case.aging_days,
+    try:
+        rows, next_cursor = keyset_page(
+            query, sort, order, CASE_SORT_KEYS[sort], DebtCase.id,
+            cursor=request.args.get("cursor"),
+            limit=request.args.get("limit", type=int)
+        )
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    return jsonify({
+        "items": [{
+            "id": r.id,
+            "case_id": r.tracking_number,
+            "customer": r.customer_name,
+            "amount": r.amount_due,
+            "aging": r.aging_days,
             "priority": (
-                case.prediction.priority_score
-                if case.prediction else "Medium"
+                r.priority_score
+                if r.priority_score is not None else "Medium"
             ),
-            "status": case.status
-        })
-
-    return jsonify(result)
+            "status": r.status
+        } for r in rows],
+        "next_cursor": next_cursor,
+        "limit": page_size(request.args.get("limit", type=int)),
+        "sort": sort,
+        "order": order
+    })
 
 @dca_bp.route("/cases/<int:case_id>", methods=["GET"])
 def get_case(case_id):
@@ -116,7 +157,9 @@ def update_case_status(case_id):
     if new_status not in allowed:
         return jsonify({"error": "Invalid status"}), 400
 
+    old_status = case.status
     case.status = "ESCALATED" if new_status == "Escalate" else new_status
+    record_status_change(case.enterprise_id, old_status, case.status)
 
     # ✅ Audit log
     db.session.add(AuditLog(
@@ -132,6 +175,7 @@ def update_case_status(case_id):
     ))
 
     db.session.commit()
+    invalidate_overview(case.enterprise_id)
     return jsonify({"status": "updated"})
 
 @dca_bp.route("/cases/<int:case_id>/notes", methods=["POST"])
@@ -1,18 +1,55 @@
 # routes/enterprise.py
-from flask import Blueprint, request, jsonify, session, abort,current_app
-from datetime import datetime, date
-import pandas as pd
+from flask import Blueprint, request, jsonify, session, abort,current_app, Response, stream_with_context
+from datetime import datetime, timedelta
+from werkzeug.utils import secure_filename
+import os
+import time
+import uuid
+from sqlalchemy import func
 
 from app import db
-from app.models.debt import DebtCase
+from app.models.debt import DebtCase, CASE_SORT_KEYS
 from app.models.case_assignment import CaseAssignment
 from app.models.case_escalation import CaseEscalation
 from app.models.case_closure import CaseClosure
 from app.models.sla import CaseSLATracking, SLADefinition
 from app.models.audit_log import AuditLog
 from app.models.organization import Organization
-from app.services.ai_prediction_service import generate_prediction
-from .analytics_chart import generate_aging_chart, generate_priority_chart
+from app.models.case_upload import CaseUpload
+from app.models.ai_prediction import AIModelPrediction, PRIORITY_BAND_RANGES, priority_band_filters
+from app.services.case_ingest_service import (
+    read_upload,
+    read_columns,
+    ingest_cases,
+    file_checksum,
+    run_upload
+)
+from app.services.case_validation_service import (
+    error_report,
+    missing_columns,
+    validate_cases
+)
+from app.services.recovery_rate_service import record_closure
+from app.services.overview_service import cached_overview, invalidate_overview
+from app.services.case_counter_service import (
+    record_status_change,
+    record_status_changes,
+    stored_status_counts
+)
+from app.services.analytics_service import aging_distribution, priority_distribution
+from app.services.case_export_service import EXPORT_FORMATS, case_columns, iter_ndjson, write_export
+from app.services.sla_service import publish_sla_event, sla_status_totals, start_sla
+from app.jobs.upload_worker import submit_upload
+from app.utils.pagination import page_size, keyset_page
+from app.utils.sql import row_dicts
+from .analytics_chart import (
+    CHART_FORMATS,
+    DEFAULT_DPI,
+    DEFAULT_SIZE,
+    DPI_RANGE,
+    SIZE_RANGE,
+    render_chart
+)
 
 enterprise_bp = Blueprint("enterprise", __name__)
 
@@ -28,120 +65,450 @@ def enterprise_dashboard():
     return "Enterprise Dashboard"
 
 # ---------- ANALYTICS ----------
+def _bounded_arg(name, default, bounds):
+    value = request.args.get(name, type=int)
+    if value is None:
+        return default
+    low, high = bounds
+    return max(low, min(value, high))
+
+
+# ?format=png (default, base64) | svg | json (the series only);
+# png and svg take ?width= ?height= ?dpi=, clamped
 @enterprise_bp.route("/analytics/charts", methods=["GET"])
 def analytics_charts():
     enterprise_only()
-    cases = DebtCase.query.filter_by(
-    enterprise_id=session["organization_id"]
-).all()
+
+    fmt = request.args.get("format", "png")
+    if fmt != "json" and fmt not in CHART_FORMATS:
+        return jsonify({"error": "Unsupported chart format"}), 400
+
+    aging = aging_distribution(session["organization_id"])
+    priority = priority_distribution(session["organization_id"])
+
+    # label order matters for the charts, so series are sent as lists
+    if fmt == "json":
+        return jsonify({
+            name: {"labels": list(counts), "values": list(counts.values())}
+            for name, counts in (("aging", aging), ("priority", priority))
+        })
+
+    dpi = _bounded_arg("dpi", DEFAULT_DPI, DPI_RANGE)
+    size = (
+        _bounded_arg("width", DEFAULT_SIZE[0], SIZE_RANGE),
+        _bounded_arg("height", DEFAULT_SIZE[1], SIZE_RANGE)
+    )
+
     return jsonify({
-        "aging_chart": generate_aging_chart(cases),
-        "priority_chart": generate_priority_chart(cases)
+        "format": fmt,
+        "aging_chart": render_chart("aging", aging, fmt, dpi, size),
+        "priority_chart": render_chart("priority", priority, fmt, dpi, size)
     })
 
-# ---------- OVERVIEW ----------
-@enterprise_bp.route("/overview", methods=["GET"])
-def enterprise_overview():
+@enterprise_bp.route("/analytics/summary", methods=["GET"])
+def analytics_summary():
     enterprise_only()
 
+    enterprise_id = session["organization_id"]
+    # case totals from the counters, the rest aggregated in one SELECT
+    counts = stored_status_counts(enterprise_id)
+
+    closed = DebtCase.status == "CLOSED"
+    recovery = AIModelPrediction.predicted_recovery_probability
+
+    row = db.session.execute(
+        db.select(
+            func.avg(CaseClosure.recovered_amount).filter(closed),
+            func.count(AIModelPrediction.id).filter(recovery >= 0.7),
+            func.count(AIModelPrediction.id).filter(recovery < 0.3),
+            func.avg(recovery),
+            *[
+                func.count(AIModelPrediction.id).filter(*priority_band_filters(band))
+                for band in PRIORITY_BAND_RANGES
+            ]
+        )
+        .select_from(DebtCase)
+        .outerjoin(AIModelPrediction, AIModelPrediction.case_id == DebtCase.id)
+        .outerjoin(CaseClosure, CaseClosure.case_id == DebtCase.id)
+        .where(DebtCase.enterprise_id == enterprise_id)
+    ).one()
+
+    avg_recovery, high, low, avg_predicted, *priorities = row
+
     return jsonify({
-        "total_overdue": DebtCase.query.filter_by(enterprise_id=session["organization_id"]).count(),
-        "in_progress": DebtCase.query.filter(
-            DebtCase.status.in_(["NEW", "PENDING"]),DebtCase.enterprise_id==session["organization_id"]
-        ).count(),
-        "escalated": DebtCase.query.filter_by(status="ESCALATED",enterprise_id=session["organization_id"]).count(),
-        "closed": DebtCase.query.filter(
-            DebtCase.status.in_(["Collected", "CLOSED"]),DebtCase.enterprise_id==session["organization_id"]
-        ).count()
+        "total": sum(counts.values()),
+        "closed": counts.get("CLOSED", 0),
+        "avg_recovery": avg_recovery or 0,
+        "high_recovery": high,
+        "low_recovery": low,
+        "avg_predicted_recovery": avg_predicted or 0,
+        "priority": dict(zip(PRIORITY_BAND_RANGES, priorities))
     })
 
-# ---------- HELPERS ----------
-def calculate_aging(due_date):
-    if not due_date:
-        return None, None
+# ---------- OVERVIEW ----------
+@enterprise_bp.route("/overview", methods=["GET"])
+def enterprise_overview():
+    enterprise_only()
+    return jsonify(cached_overview(session["organization_id"]))
 
-    if isinstance(due_date, str):
-        try:
-            due_date = datetime.strptime(due_date, "%Y-%m-%d").date()
-        except ValueError:
-            return None, None
+# ---------- BULK UPLOAD ----------
+def upload_to_dict(upload):
+    return {
+        "upload_id": upload.id,
+        "status": upload.status,
+        "filename": upload.filename,
+        "chunk_size": upload.chunk_size,
+        "chunks_committed": upload.chunks_committed,
+        "rows_processed": upload.rows_processed,
+        "rows_created": upload.rows_created,
+        "rows_skipped": upload.rows_skipped,
+        "rows_invalid": upload.rows_invalid,
+        "validation_errors": upload.validation_errors or [],
+        "error": upload.error,
+        "created_at": upload.created_at,
+        "completed_at": upload.completed_at
+    }
+
+
+# Moves a FAILED upload, or one left QUEUED/RUNNING by a process that died,
+# to status. Conditional UPDATE: only one request ever wins the claim.
+def claim_upload(upload, status):
+    stale_before = datetime.utcnow() - timedelta(seconds=current_app.config["UPLOAD_STALE_AFTER"])
+    claimed = db.session.execute(
+        db.update(CaseUpload)
+        .where(
+            CaseUpload.id == upload.id,
+            db.or_(
+                CaseUpload.status == "FAILED",
+                db.and_(
+                    CaseUpload.status.in_(("QUEUED", "RUNNING")),
+                    CaseUpload.updated_at < stale_before
+                )
+            )
+        )
+        .values(status=status, updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.session.commit()
 
-    days = (date.today() - due_date).days
+    db.session.refresh(upload)
+    return bool(claimed)
 
-    if days <= 30:
-        return days, "0-30"
-    if days <= 60:
-        return days, "31-60"
-    if days <= 90:
-        return days, "61-90"
-    return days, "90+"
 
-# ---------- BULK UPLOAD ----------
-@enterprise_bp.route("/cases/upload", methods=["POST"])
-def upload_cases():
-    enterprise_only()
+def upload_chunk_size():
+    value = request.args.get("chunk_size")
+    if value is None:
+        return current_app.config["UPLOAD_CHUNK_SIZE"]
+    if not value.isdigit() or int(value) < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    return min(int(value), current_app.config["MAX_UPLOAD_CHUNK_SIZE"])
 
-    file = request.files["file"]
-    df = pd.read_csv(file) if file.filename.endswith(".csv") else pd.read_excel(file)
 
-    created = 0
+def new_upload(file, chunk_size):
+    return CaseUpload(
+        enterprise_id=session["organization_id"],
+        uploaded_by=session.get("user_id"),
+        filename=file.filename,
+        file_sha256=file_checksum(file),
+        chunk_size=chunk_size
+    )
 
-    for _, row in df.iterrows():
-        if DebtCase.query.filter_by(tracking_number=row["tracking_number"]).first():
-            continue
 
-        aging_days, aging_bucket = calculate_aging(row.get("due_date"))
+def upload_cases_in_chunks(file, chunk_size):
+    if not file.filename.endswith(".csv"):
+        return jsonify({"error": "stream mode requires a CSV file"}), 400
 
-        case = DebtCase(
-            tracking_number=row["tracking_number"],
-            customer_name=row["customer_name"],
-            amount_due=row["amount_due"],
-            due_date=row.get("due_date"),
-            aging_days=aging_days,
-            aging_bucket=aging_bucket,
-            status="NEW",
+    resume_id = request.args.get("resume", type=int)
+
+    if resume_id:
+        upload = CaseUpload.query.filter_by(
+            id=resume_id,
             enterprise_id=session["organization_id"]
-        )
+        ).first_or_404()
+
+        if upload.file_sha256 != file_checksum(file):
+            return jsonify({"error": "File does not match the upload being resumed"}), 409
+
+        # background jobs own their stored file, they resume through /resume
+        if upload.stored_path:
+            return jsonify({"error": "Background uploads are resumed through /resume"}), 409
 
-        db.session.add(case)
-        db.session.flush()
-        generate_prediction(case)
-        created += 1
+        if not claim_upload(upload, "RUNNING"):
+            return jsonify({"error": "Only failed or stalled uploads can be resumed"}), 409
+    else:
+        upload = new_upload(file, chunk_size)
+        db.session.add(upload)
+
+    try:
+        run_upload(upload, file)
+    except Exception:
+        current_app.logger.exception("Chunked upload %s failed", upload.id)
+        # progress up to the last committed chunk is kept for ?resume=
+        return jsonify(upload_to_dict(upload)), 500
+
+    return jsonify({"created": upload.rows_created, **upload_to_dict(upload)})
+
+
+def missing_columns_response(columns):
+    missing = missing_columns(columns)
+    if missing:
+        return jsonify({
+            "error": f"Missing required columns: {', '.join(missing)}",
+            "missing_columns": missing
+        }), 400
+    return None
+
+
+def upload_cases_now(file):
+    started = time.perf_counter()
+    df = read_upload(file)
+
+    clean, errors = validate_cases(df)
+    report = error_report(errors)
+
+    # nothing worth inserting, reject before touching the DB
+    if errors and clean.empty:
+        return jsonify({"error": "No valid rows in the file", **report}), 400
+
+    created, skipped = ingest_cases(clean, session["organization_id"])
+
+    elapsed = time.perf_counter() - started
+    stats = {
+        "rows_created": created,
+        "rows_skipped": skipped,
+        "rows_invalid": len(errors),
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(len(df) / elapsed, 1) if elapsed else None
+    }
 
     db.session.add(AuditLog(
         entity_type="DebtCase",
         action="BULK_UPLOAD",
         performed_by=session.get("user_id"),
         performed_at=datetime.utcnow(),
-        audit_metadata={"rows_created": created}
+        audit_metadata=stats
     ))
 
     db.session.commit()
-    return jsonify({"created": created})
+    invalidate_overview(session["organization_id"])
+    return jsonify({"created": created, **stats, **report})
+
+
+@enterprise_bp.route("/cases/upload", methods=["POST"])
+def upload_cases():
+    enterprise_only()
+
+    file = request.files["file"]
+    mode = request.args.get("mode")
+
+    try:
+        chunk_size = upload_chunk_size()
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    # a file without the required columns is refused before anything runs
+    rejected = missing_columns_response(read_columns(file))
+    if rejected:
+        return rejected
+
+    # ?mode=stream bounds memory to one chunk and makes the upload resumable
+    if mode == "stream":
+        return upload_cases_in_chunks(file, chunk_size)
+
+    # ?mode=sync does the whole file in this request, in one transaction
+    if mode == "sync":
+        return upload_cases_now(file)
+
+    # Default: persist the file and hand it to the background workers
+    upload = new_upload(file, chunk_size)
+    upload.status = "QUEUED"
+    db.session.add(upload)
+    db.session.flush()
+
+    folder = current_app.config["UPLOAD_FOLDER"]
+    os.makedirs(folder, exist_ok=True)
+    upload.stored_path = os.path.join(
+        folder, f"{upload.id}-{secure_filename(file.filename)}"
+    )
+    file.save(upload.stored_path)
+
+    db.session.commit()
+    submit_upload(current_app._get_current_object(), upload.id)
+
+    return jsonify({"job_id": upload.id, **upload_to_dict(upload)}), 202
+
+
+@enterprise_bp.route("/uploads/<int:job_id>", methods=["GET"])
+def upload_status(job_id):
+    enterprise_only()
+
+    upload = CaseUpload.query.filter_by(
+        id=job_id,
+        enterprise_id=session["organization_id"]
+    ).first_or_404()
+
+    return jsonify(upload_to_dict(upload))
+
+
+@enterprise_bp.route("/uploads/<int:job_id>/resume", methods=["POST"])
+def resume_upload(job_id):
+    enterprise_only()
+
+    upload = CaseUpload.query.filter_by(
+        id=job_id,
+        enterprise_id=session["organization_id"]
+    ).first_or_404()
+
+    if not upload.stored_path:
+        return jsonify({"error": "Only background uploads can be resumed"}), 409
+
+    if not claim_upload(upload, "QUEUED"):
+        return jsonify({"error": "Only failed or stalled background uploads can be resumed"}), 409
+
+    submit_upload(current_app._get_current_object(), upload.id)
+
+    return jsonify(upload_to_dict(upload)), 202
 
 # ---------- LIST CASES ----------
+CASE_LIST_COLUMNS = case_columns(
+    "id", "tracking_number", "customer_name", "amount_due", "aging_bucket", "aging_days",
+    "status", "recovery_probability", "priority_score", "recovered_amount"
+)
+
+
+def _csv_arg(name):
+    value = request.args.get(name)
+    return [v for v in value.split(",") if v] if value else []
+
+
+def case_filters():
+    filters = [DebtCase.enterprise_id == session["organization_id"]]
+
+    statuses = _csv_arg("status")
+    if statuses:
+        filters.append(DebtCase.status.in_(statuses))
+
+    buckets = _csv_arg("aging_bucket")
+    if buckets:
+        filters.append(DebtCase.aging_bucket.in_(buckets))
+
+    ranges = (
+        ("min_priority", AIModelPrediction.priority_score.__ge__),
+        ("max_priority", AIModelPrediction.priority_score.__le__),
+        ("min_amount", DebtCase.amount_due.__ge__),
+        ("max_amount", DebtCase.amount_due.__le__)
+    )
+    for name, compare in ranges:
+        value = request.args.get(name, type=float)
+        if value is not None:
+            filters.append(compare(value))
+
+    return filters
+
+
 @enterprise_bp.route("/cases", methods=["GET"])
 def list_cases():
     enterprise_only()
-    cases = DebtCase.query.filter_by(
-    enterprise_id=session["organization_id"]
-).all()
-    
-    return jsonify([{
-        "id": c.id,
-        "tracking_number": c.tracking_number,
-        "customer_name": c.customer_name,
-        "amount_due": c.amount_due,
-        "aging_bucket": c.aging_bucket,
-        "status": c.status,
-        "recovery_probability": c.prediction.predicted_recovery_probability if c.prediction else None,
-        "priority_score": c.prediction.priority_score if c.prediction else None,
-        # ✅ SAFE closure access
-    "recovered_amount": (
-        c.closure.recovered_amount
-        if c.closure else None
+
+    sort = request.args.get("sort", "priority_score")
+    order = request.args.get("order", "desc")
+    if sort not in CASE_SORT_KEYS or order not in ("asc", "desc"):
+        return jsonify({"error": "Invalid sort or order"}), 400
+
+    # plain columns only: one statement per page, no entities, no lazy loads
+    query = (
+        db.select(*CASE_LIST_COLUMNS)
+        .select_from(DebtCase)
+        .outerjoin(AIModelPrediction, AIModelPrediction.case_id == DebtCase.id)
+        .outerjoin(CaseClosure, CaseClosure.case_id == DebtCase.id)
+        .where(*case_filters())
     )
-    } for c in cases])
+
+    try:
+        rows, next_cursor = keyset_page(
+            query, sort, order, CASE_SORT_KEYS[sort], DebtCase.id,
+            cursor=request.args.get("cursor"),
+            limit=request.args.get("limit", type=int)
+        )
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    return jsonify({
+        "items": row_dicts(CASE_LIST_COLUMNS, rows),
+        "next_cursor": next_cursor,
+        "limit": page_size(request.args.get("limit", type=int)),
+        "sort": sort,
+        "order": order
+    })
+
+# ---------- EXPORT ----------
+EXPORT_MIMETYPES = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet"
+}
+
+
+def _remove_export(path):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def _export_file_response(path, fmt, filename, block_size=1 << 16):
+    f = open(path, "rb")
+
+    # the export only lives for the download, it goes when the response is
+    # closed (read or not); removing it while still open fails on Windows
+    def close():
+        f.close()
+        _remove_export(path)
+
+    response = Response(
+        iter(lambda: f.read(block_size), b""),
+        mimetype=EXPORT_MIMETYPES[fmt],
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Content-Length": str(os.fstat(f.fileno()).st_size)
+        }
+    )
+    response.call_on_close(close)
+    return response
+
+@enterprise_bp.route("/cases/export", methods=["GET"])
+def export_cases():
+    enterprise_only()
+
+    fmt = request.args.get("format", "ndjson")
+    filename = f"cases-{session['organization_id']}-{datetime.utcnow():%Y%m%d%H%M%S}.{fmt}"
+
+    # ndjson streams off the DB cursor, csv/parquet go through a file
+    if fmt == "ndjson":
+        return Response(
+            stream_with_context(iter_ndjson(case_filters())),
+            mimetype="application/x-ndjson",
+            headers={
+                "Content-Disposition": f"attachment; filename={filename}",
+                # keep reverse proxies from buffering the whole stream
+                "X-Accel-Buffering": "no"
+            }
+        )
+
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": "Unsupported export format"}), 400
+
+    folder = current_app.config["EXPORT_FOLDER"]
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, f"{uuid.uuid4().hex}-{filename}")
+
+    try:
+        write_export(path, fmt, case_filters())
+    except Exception as exc:
+        # write_export has closed the file by the time it raises
+        _remove_export(path)
+        if isinstance(exc, ValueError):
+            return jsonify({"error": str(exc)}), 400
+        raise
+
+    return _export_file_response(path, fmt, filename)
 
 # ---------- ASSIGN ----------
 @enterprise_bp.route("/assign", methods=["POST"])
@@ -158,6 +525,7 @@ def assign_cases():
 
     sla = SLADefinition.query.filter_by(active=True).first()
     assigned_by = session.get("user_id")
+    status_changes = []
 
     for case_id in case_ids:
         existing_assignment = CaseAssignment.query.filter_by(
@@ -181,6 +549,7 @@ def assign_cases():
         if case and case.status == "NEW":
             case.status = "PENDING"
             db.session.add(case)
+            status_changes.append((case.enterprise_id, "NEW", "PENDING"))
 
         # ✅ START SLA
         if sla:
@@ -190,12 +559,9 @@ def assign_cases():
             ).first()
 
             if not existing_sla:
-                db.session.add(CaseSLATracking(
-                    case_id=case_id,
-                    sla_definition_id=sla.id,
-                    started_at=datetime.utcnow(),
-                    status="RUNNING"
-                ))
+                start_sla(case_id, sla)
+
+    record_status_changes(status_changes)
 
     db.session.add(AuditLog(
         entity_type="CaseAssignment",
@@ -205,20 +571,154 @@ def assign_cases():
     ))
 
     db.session.commit()
+    invalidate_overview(session["organization_id"])
     return jsonify({"status": "assigned"})
 
 # ---------- SLA ----------
+SLA_STATUSES = CaseSLATracking.__table__.c.status.type.enums
+
+SLA_LIST_COLUMNS = (
+    CaseSLATracking.id,
+    CaseSLATracking.case_id,
+    CaseSLATracking.status,
+    CaseSLATracking.started_at,
+    CaseSLATracking.due_at,
+    CaseSLATracking.warned_at,
+    CaseSLATracking.breached_at
+)
+# with the columns of the SLA's definition, joined in the same SELECT
+SLA_STATUS_LIST_COLUMNS = SLA_LIST_COLUMNS + (
+    SLADefinition.name.label("sla_name"),
+    SLADefinition.max_resolution_hours,
+    SLADefinition.escalation_threshold_hours
+)
+
+SLA_SORT_KEYS = {
+    "id": CaseSLATracking.id,
+    # SLAs predating due_at sort first
+    "due_at": func.coalesce(CaseSLATracking.due_at, datetime(1970, 1, 1))
+}
+
+
+# raises ValueError for bad values
+def sla_filters():
+    filters = [DebtCase.enterprise_id == session["organization_id"]]
+
+    statuses = _csv_arg("status")
+    if statuses:
+        unknown = set(statuses) - set(SLA_STATUSES)
+        if unknown:
+            raise ValueError(f"Unknown SLA status: {', '.join(sorted(unknown))}")
+        filters.append(CaseSLATracking.status.in_(statuses))
+
+    case_ids = _csv_arg("case_ids")
+    if case_ids:
+        try:
+            filters.append(CaseSLATracking.case_id.in_([int(i) for i in case_ids]))
+        except ValueError:
+            raise ValueError("case_ids must be integers")
+
+    return filters
+
+
+# One keyset page of the enterprise's SLAs, paginated like list_cases;
+# the first page also carries the SLA count per status
+def sla_listing(columns, with_definition):
+    enterprise_only()
+
+    sort = request.args.get("sort", "id")
+    order = request.args.get("order", "asc")
+    if sort not in SLA_SORT_KEYS or order not in ("asc", "desc"):
+        return jsonify({"error": "Invalid sort or order"}), 400
+
+    try:
+        filters = sla_filters()
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    query = (
+        db.select(*columns)
+        .select_from(CaseSLATracking)
+        .join(DebtCase, DebtCase.id == CaseSLATracking.case_id)
+        .where(*filters)
+    )
+    if with_definition:
+        query = query.outerjoin(SLADefinition, SLADefinition.id == CaseSLATracking.sla_definition_id)
+
+    cursor = request.args.get("cursor")
+    try:
+        rows, next_cursor = keyset_page(
+            query, sort, order, SLA_SORT_KEYS[sort], CaseSLATracking.id,
+            cursor=cursor,
+            limit=request.args.get("limit", type=int)
+        )
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    response = {
+        "items": row_dicts(columns, rows),
+        "next_cursor": next_cursor,
+        "limit": page_size(request.args.get("limit", type=int)),
+        "sort": sort,
+        "order": order
+    }
+    if not cursor:
+        response["totals"] = sla_status_totals(session["organization_id"])
+    return jsonify(response)
+
+
 @enterprise_bp.route("/sla", methods=["GET"])
 def sla_monitor():
+    return sla_listing(SLA_LIST_COLUMNS, with_definition=False)
+
+AT_RISK_COLUMNS = (
+    DebtCase.id.label("case_id"),
+    *case_columns("tracking_number", "customer_name", "amount_due"),
+    DebtCase.status.label("case_status"),
+    SLADefinition.name.label("sla_name"),
+    CaseSLATracking.started_at,
+    CaseSLATracking.warn_at,
+    CaseSLATracking.warned_at,
+    CaseSLATracking.due_at
+)
+
+
+@enterprise_bp.route("/sla/at-risk", methods=["GET"])
+def sla_at_risk():
     enterprise_only()
-    slas = CaseSLATracking.query.all()
 
-    return jsonify([{
-        "case_id": s.case_id,
-        "status": s.status,
-        "started_at": s.started_at,
-        "breached_at": s.breached_at
-    } for s in slas])
+    now = datetime.utcnow()
+    query = (
+        db.select(*AT_RISK_COLUMNS)
+        .select_from(CaseSLATracking)
+        .join(DebtCase, DebtCase.id == CaseSLATracking.case_id)
+        .join(SLADefinition, SLADefinition.id == CaseSLATracking.sla_definition_id)
+        .where(
+            DebtCase.enterprise_id == session["organization_id"],
+            CaseSLATracking.status == "RUNNING",
+            CaseSLATracking.warn_at <= now
+        )
+    )
+
+    try:
+        rows, next_cursor = keyset_page(
+            query, "due_at", "asc", CaseSLATracking.due_at, CaseSLATracking.id,
+            cursor=request.args.get("cursor"),
+            limit=request.args.get("limit", type=int)
+        )
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    # negative for SLAs past due that the breach check has not flagged yet
+    items = row_dicts(AT_RISK_COLUMNS, rows)
+    for item in items:
+        item["seconds_remaining"] = int((item["due_at"] - now).total_seconds())
+
+    return jsonify({
+        "items": items,
+        "next_cursor": next_cursor,
+        "limit": page_size(request.args.get("limit", type=int))
+    })
 
 # ---------- CLOSE CASE ----------
 # ---------- CLOSE / DISPUTE CASE ----------
@@ -239,6 +739,7 @@ def close_case(id):
         return jsonify({"error": "Case already closed"}), 400
 
     is_dispute = closure_reason == "DISPUTE"
+    old_status = case.status
 
     if is_dispute:
         case.status = "DISPUTED"
@@ -251,6 +752,7 @@ def close_case(id):
         if sla:
             sla.status = "PAUSED"
             sla.paused_at = datetime.utcnow()
+            publish_sla_event("completed", id)
 
         audit_action = "DISPUTE"
 
@@ -266,6 +768,7 @@ def close_case(id):
             closed_by=session["user_id"],
             closed_at=datetime.utcnow()
         ))
+        record_closure(case.enterprise_id, recovered_amount, case.amount_due)
 
         case.status = "CLOSED"
         case.closed_at = datetime.utcnow()
@@ -278,10 +781,13 @@ def close_case(id):
         if sla:
             sla.status = "COMPLETED"
             sla.completed_at = datetime.utcnow()
+            publish_sla_event("completed", id)
 
         # audit action reflects business outcome
         audit_action = closure_reason
 
+    record_status_change(case.enterprise_id, old_status, case.status)
+
     db.session.add(AuditLog(
         entity_type="DebtCase",
         entity_id=id,
@@ -291,6 +797,7 @@ def close_case(id):
     ))
 
     db.session.commit()
+    invalidate_overview(case.enterprise_id)
 
     return jsonify({
         "status": "closed"
@@ -314,25 +821,7 @@ def list_dcas():
 
 @enterprise_bp.route("/sla/status", methods=["GET"])
 def sla_status_overview():
-    enterprise_only()
-
-    enterprise_id = session["organization_id"]
-
-    slas = (
-        CaseSLATracking.query
-        .join(DebtCase, DebtCase.id == CaseSLATracking.case_id)
-        .filter(DebtCase.enterprise_id == enterprise_id)
-        .all()
-    )
-
-    return jsonify([{
-        "case_id": s.case_id,
-        "status": s.status,
-        "started_at": s.started_at,
-        "breached_at": s.breached_at,
-        "sla_name": s.sla_definition.name,
-        "max_resolution_hours": s.sla_definition.max_resolution_hours
-    } for s in slas])
+    return sla_listing(SLA_STATUS_LIST_COLUMNS, with_definition=True)
 
 
 @enterprise_bp.route("/escalations/pending", methods=["GET"])
@@ -385,6 +874,7 @@ def approve_escalation():
 
     # ---- UPDATE CASE ----
     case = DebtCase.query.get_or_404(case_id)
+    record_status_change(case.enterprise_id, case.status, "ESCALATED")
     case.status = "ESCALATED"
 
     # ---- UNASSIGN DCA ----
@@ -405,6 +895,7 @@ def approve_escalation():
     if sla:
         sla.status = "COMPLETED"
         sla.breached_at = datetime.utcnow()
+        publish_sla_event("completed", case_id)
 
     # ---- AUDIT LOG ----
     db.session.add(AuditLog(
@@ -416,6 +907,7 @@ def approve_escalation():
     ))
 
     db.session.commit()
+    invalidate_overview(case.enterprise_id)
     return jsonify({"status": "approved"})
 
 
@@ -441,6 +933,7 @@ def reject_escalation():
     case = DebtCase.query.get_or_404(case_id)
 
     if case.status != "CLOSED":
+        record_status_change(case.enterprise_id, case.status, "PENDING")
         case.status = "PENDING"   # 👈 BACK TO DCA FLOW
 
     # ---- ENSURE CASE IS STILL ASSIGNED ----
@@ -468,12 +961,7 @@ def reject_escalation():
         if not existing_sla:
             sla_def = SLADefinition.query.filter_by(active=True).first()
             if sla_def:
-                db.session.add(CaseSLATracking(
-                    case_id=case_id,
-                    sla_definition_id=sla_def.id,
-                    started_at=datetime.utcnow(),
-                    status="RUNNING"
-                ))
+                start_sla(case_id, sla_def)
 
     # ---- AUDIT LOG ----
     db.session.add(AuditLog(
@@ -485,4 +973,5 @@ def reject_escalation():
     ))
 
     db.session.commit()
+    invalidate_overview(case.enterprise_id)
     return jsonify({"status": "rejected"})
\ No newline at end of file
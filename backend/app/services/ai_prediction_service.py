@@ -1,90 +1,197 @@
-from datetime import date,datetime
-from sqlalchemy import func
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, update
 from app.models.debt import DebtCase
-from app.models.case_closure import CaseClosure
 from app.models.case_escalation import CaseEscalation
 from app.models.ai_prediction import AIModelPrediction
+from app.services.recovery_rate_service import recovery_rates
+from app.utils.sql import dialect_insert
 from app import db
 
+MODEL_VERSION = "rule_based_v2"
+
+# Aging weight (non-linear)
+AGING_WEIGHTS = {
+    "0-30": 0.15,
+    "31-60": 0.35,
+    "61-90": 0.65,
+    "90+": 0.9
+}
+
+# Largest IN (...) list sent in one statement
+ID_BATCH_SIZE = 5000
+
+URGENCY = {
+    "0-30": 0.2,
+    "31-60": 0.5,
+    "61-90": 0.8,
+    "90+": 1.0
+}
+
+
+def score_cases(aging_buckets, amounts_due, escalation_counts, historical_recovery):
+    """Array version of the rule-based model.
+
+    Takes parallel sequences (one entry per case; ``historical_recovery``
+    may also be a single rate for the whole batch) and returns
+    ``(recovery_probability, priority_score)`` as NumPy arrays.
+    """
+    buckets = pd.Series(aging_buckets, dtype=object)
+    amounts = np.asarray(amounts_due, dtype=float)
+    escalations = np.asarray(escalation_counts, dtype=float)
+
+    aging_weight = buckets.map(AGING_WEIGHTS).fillna(0.5).to_numpy(dtype=float)
+    urgency = buckets.map(URGENCY).fillna(0.5).to_numpy(dtype=float)
+
+    escalation_penalty = np.minimum(escalations * 0.15, 0.6)
+    amount_risk = np.minimum(amounts / 100000, 1)
+
+    recovery = (
+        0.45 * historical_recovery
+        + 0.30 * (1 - aging_weight)
+        - 0.15 * escalation_penalty
+        - 0.10 * amount_risk
+    )
+    recovery = np.round(np.clip(recovery, 0, 1), 2)
+
+    financial_impact = np.minimum(amounts / 75000, 1)
+    priority = (
+        0.45 * urgency
+        + 0.35 * financial_impact
+        + 0.20 * recovery
+    )
+    priority = np.round(np.minimum(priority, 1), 2)
 
-def build_case_features(case: DebtCase):
-    # Aging weight (non-linear)
-    aging_weight = {
-        "0-30": 0.15,
-        "31-60": 0.35,
-        "61-90": 0.65,
-        "90+": 0.9
-    }.get(case.aging_bucket, 0.5)
+    return recovery, priority
 
-    # Escalations (recent escalations matter more)
-    escalation_count = CaseEscalation.query.filter_by(case_id=case.id).count()
-    escalation_penalty = min(escalation_count * 0.15, 0.6)
 
-    # Historical recovery rate (organization-aware if possible)
-    historical_recovery_rate = (
-        db.session.query(
-            func.avg(CaseClosure.recovered_amount / DebtCase.amount_due)
+def escalation_counts(case_ids):
+    """Escalations per case, one grouped query per ``ID_BATCH_SIZE`` ids."""
+    counts = {}
+    for start in range(0, len(case_ids), ID_BATCH_SIZE):
+        counts.update(
+            db.session.query(CaseEscalation.case_id, func.count(CaseEscalation.id))
+            .filter(CaseEscalation.case_id.in_(case_ids[start:start + ID_BATCH_SIZE]))
+            .group_by(CaseEscalation.case_id)
+            .all()
         )
-        .join(DebtCase, DebtCase.id == CaseClosure.case_id)
-        .scalar()
-        or 0.4
-    )
+    return counts
+
+
+PREDICTION_COLUMNS = (
+    "model_version",
+    "predicted_recovery_probability",
+    "priority_score",
+    "predicted_at"
+)
+
+# Rows per upsert statement when the driver batches VALUES lists
+# (psycopg2); 5 binds a row stays under Postgres' 65535 limit
+UPSERT_BATCH_SIZE = 5000
+
+
+def bulk_upsert_predictions(rows, sync_priority_sort=True):
+    """Write ``AIModelPrediction`` rows keyed by their unique ``case_id``.
 
-    # Amount risk (larger amount = harder recovery)
-    amount_risk = min(case.amount_due / 100000, 1)
+    One ``INSERT ... ON CONFLICT (case_id) DO UPDATE`` executed for all
+    rows: psycopg2 sends it as multi-row VALUES statements of
+    ``UPSERT_BATCH_SIZE`` rows, SQLite as a single executemany. Rows need
+    ``case_id`` plus the prediction columns; ``predicted_at`` defaults to
+    now. ``DebtCase.priority_sort`` is updated to match, in one more
+    executemany, unless the caller already wrote it. Nothing is committed.
 
-    return {
-        "aging_weight": aging_weight,
-        "escalation_penalty": escalation_penalty,
-        "historical_recovery": historical_recovery_rate,
-        "amount_risk": amount_risk
-    }
+    Returns the number of rows written.
+    """
+    if not rows:
+        return 0
 
+    now = datetime.utcnow()
+    rows = [{"predicted_at": now, **row} for row in rows]
 
-def predict_recovery_probability(features: dict) -> float:
-    score = (
-        0.45 * features["historical_recovery"]
-        + 0.30 * (1 - features["aging_weight"])
-        - 0.15 * features["escalation_penalty"]
-        - 0.10 * features["amount_risk"]
+    insert = dialect_insert()
+    stmt = insert(AIModelPrediction)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[AIModelPrediction.case_id],
+        set_={column: stmt.excluded[column] for column in PREDICTION_COLUMNS}
+    )
+    db.session.execute(
+        stmt,
+        rows,
+        execution_options={"insertmanyvalues_page_size": UPSERT_BATCH_SIZE}
     )
 
-    return round(min(max(score, 0), 1), 2)
+    if sync_priority_sort:
+        db.session.execute(
+            update(DebtCase),
+            [{"id": row["case_id"], "priority_sort": row["priority_score"]} for row in rows]
+        )
 
+    return len(rows)
 
-def compute_priority_score(case: DebtCase, recovery_probability: float) -> float:
-    urgency = {
-        "0-30": 0.2,
-        "31-60": 0.5,
-        "61-90": 0.8,
-        "90+": 1.0
-    }.get(case.aging_bucket, 0.5)
 
-    financial_impact = min(case.amount_due / 75000, 1)
+def predict_batch(cases, model_version=MODEL_VERSION):
+    """Score many cases at once, without writing anything.
 
-    priority = (
-        0.45 * urgency
-        + 0.35 * financial_impact
-        + 0.20 * recovery_probability
+    ``cases`` can be ``DebtCase`` objects or any rows exposing ``id``,
+    ``enterprise_id``, ``aging_bucket`` and ``amount_due``. The features
+    are computed with ``score_cases`` over the whole batch; the DB is hit
+    once for the escalation counts and once for the recovery rate
+    aggregates.
+
+    Returns ``AIModelPrediction`` column dicts, one per case.
+    """
+    cases = list(cases)
+    if not cases:
+        return []
+
+    case_ids = [c.id for c in cases]
+    counts = escalation_counts(case_ids)
+    rates = recovery_rates({c.enterprise_id for c in cases})
+
+    recovery, priority = score_cases(
+        [c.aging_bucket for c in cases],
+        [c.amount_due for c in cases],
+        [counts.get(case_id, 0) for case_id in case_ids],
+        np.array([rates[c.enterprise_id] for c in cases])
     )
 
-    return round(min(priority, 1), 2)
+    predicted_at = datetime.utcnow()
+    return [
+        {
+            "case_id": case_id,
+            "model_version": model_version,
+            "predicted_recovery_probability": float(p_recovery),
+            "priority_score": float(p_priority),
+            "predicted_at": predicted_at
+        }
+        for case_id, p_recovery, p_priority in zip(case_ids, recovery, priority)
+    ]
 
 
-def generate_prediction(case: DebtCase):
-    features = build_case_features(case)
-    recovery_probability = predict_recovery_probability(features)
-    priority_score = compute_priority_score(case, recovery_probability)
+def generate_predictions(cases, model_version=MODEL_VERSION, commit=True):
+    """Score many cases with ``predict_batch`` and write the predictions
+    with ``bulk_upsert_predictions``.
 
-    prediction = AIModelPrediction.query.filter_by(case_id=case.id).first()
-    if not prediction:
-        prediction = AIModelPrediction(case_id=case.id)
+    Returns the number of predictions written.
+    """
+    cases = list(cases)
+    rows = predict_batch(cases, model_version)
+    if not rows:
+        return 0
 
-    prediction.predicted_recovery_probability = recovery_probability
-    prediction.priority_score = priority_score
-    prediction.model_version = "rule_based_v2"
-    prediction.predicted_at = datetime.utcnow()
+    bulk_upsert_predictions(rows)
 
-    db.session.add(prediction)
-    db.session.commit()
+    if commit:
+        db.session.commit()
+    else:
+        # the upsert bypassed the identity map, reload on next access
+        for case in cases:
+            if isinstance(case, DebtCase):
+                db.session.expire(case, ["prediction"])
 
+    return len(rows)
+
+
+def generate_prediction(case: DebtCase):
+    generate_predictions([case])
@@ -0,0 +1,48 @@
+from sqlalchemy import String, case, cast, func
+from app import db
+from app.models.debt import DebtCase
+from app.models.ai_prediction import AIModelPrediction, PRIORITY_BANDS
+from app.services.case_ingest_service import AGING_LABELS
+
+# Label of cases without an aging bucket
+UNKNOWN_BUCKET = "Unknown"
+
+
+def aging_distribution(enterprise_id):
+    """``{aging_bucket: case_count}`` in bucket order, counted in SQL."""
+    # cast first, Postgres would read the fallback label as an enum value
+    bucket = func.coalesce(cast(DebtCase.aging_bucket, String), UNKNOWN_BUCKET)
+    counts = dict(
+        db.session.execute(
+            db.select(bucket, func.count())
+            .where(DebtCase.enterprise_id == enterprise_id)
+            .group_by(bucket)
+        ).all()
+    )
+    return {
+        label: counts[label]
+        for label in (*AGING_LABELS, UNKNOWN_BUCKET)
+        if label in counts
+    }
+
+
+def priority_distribution(enterprise_id):
+    """``{band: case_count}`` over the cases that have a prediction."""
+    band = case(
+        *[
+            (AIModelPrediction.priority_score >= low, label)
+            for label, low in PRIORITY_BANDS
+            if low is not None
+        ],
+        else_=PRIORITY_BANDS[-1][0]
+    )
+    counts = dict(
+        db.session.execute(
+            db.select(band, func.count())
+            .select_from(DebtCase)
+            .join(AIModelPrediction, AIModelPrediction.case_id == DebtCase.id)
+            .where(DebtCase.enterprise_id == enterprise_id)
+            .group_by(band)
+        ).all()
+    )
+    return {label: counts.get(label, 0) for label, _ in PRIORITY_BANDS}
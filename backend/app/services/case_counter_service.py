@@ -0,0 +1,118 @@
+from collections import Counter
+from datetime import datetime
+from sqlalchemy import func
+from app import db
+from app.models.debt import DebtCase
+from app.models.case_status_count import CaseStatusCount
+from app.utils.sql import dialect_insert
+
+
+def _status_key(status):
+    return status or ""
+
+
+def adjust_status_counts(deltas):
+    """Apply ``{(enterprise_id, status): delta}`` to ``case_status_counts``.
+
+    One upsert for all deltas, in the caller's transaction so the counters
+    move together with the case rows. Cases without an enterprise are not
+    counted.
+    """
+    rows = [
+        {
+            "enterprise_id": enterprise_id,
+            "status": _status_key(status),
+            "case_count": delta,
+            "updated_at": datetime.utcnow()
+        }
+        for (enterprise_id, status), delta in deltas.items()
+        if delta and enterprise_id is not None
+    ]
+    if not rows:
+        return
+
+    insert = dialect_insert()
+    stmt = insert(CaseStatusCount)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CaseStatusCount.enterprise_id, CaseStatusCount.status],
+        set_={
+            "case_count": CaseStatusCount.case_count + stmt.excluded.case_count,
+            "updated_at": stmt.excluded.updated_at
+        }
+    )
+    db.session.execute(stmt, rows)
+
+
+def record_status_changes(changes):
+    """Count ``(enterprise_id, old_status, new_status)`` transitions."""
+    deltas = Counter()
+    for enterprise_id, old_status, new_status in changes:
+        if _status_key(old_status) == _status_key(new_status):
+            continue
+        deltas[enterprise_id, _status_key(old_status)] -= 1
+        deltas[enterprise_id, _status_key(new_status)] += 1
+    adjust_status_counts(deltas)
+
+
+def record_status_change(enterprise_id, old_status, new_status):
+    record_status_changes([(enterprise_id, old_status, new_status)])
+
+
+def record_new_cases(enterprise_id, count, status="NEW"):
+    adjust_status_counts({(enterprise_id, status): count})
+
+
+def stored_status_counts(enterprise_id):
+    """``{status: case_count}`` of one enterprise, read from the counters."""
+    return dict(
+        db.session.execute(
+            db.select(CaseStatusCount.status, CaseStatusCount.case_count)
+            .where(
+                CaseStatusCount.enterprise_id == enterprise_id,
+                CaseStatusCount.case_count != 0
+            )
+        ).all()
+    )
+
+
+def compute_status_counts():
+    """Count every enterprise's cases by status straight from ``debt_cases``."""
+    rows = db.session.execute(
+        db.select(
+            DebtCase.enterprise_id,
+            func.coalesce(DebtCase.status, ""),
+            func.count()
+        )
+        .where(DebtCase.enterprise_id.isnot(None))
+        .group_by(DebtCase.enterprise_id, func.coalesce(DebtCase.status, ""))
+    ).all()
+    return {(enterprise_id, status): count for enterprise_id, status, count in rows}
+
+
+def reconcile_status_counts(dry_run=False):
+    """Compare the counters with ``debt_cases`` and repair them.
+
+    Returns ``{(enterprise_id, status): (stored, actual)}`` for every
+    counter that drifted. Unless ``dry_run``, the drifted counters are
+    corrected and committed.
+    """
+    actual = compute_status_counts()
+    stored = {
+        (c.enterprise_id, c.status): c.case_count
+        for c in CaseStatusCount.query.all()
+    }
+
+    drift = {
+        key: (stored.get(key, 0), actual.get(key, 0))
+        for key in set(stored) | set(actual)
+        if stored.get(key, 0) != actual.get(key, 0)
+    }
+
+    if drift and not dry_run:
+        adjust_status_counts({
+            key: actual_count - stored_count
+            for key, (stored_count, actual_count) in drift.items()
+        })
+        db.session.commit()
+
+    return drift
@@ -0,0 +1,153 @@
+from datetime import date, datetime
+import json
+import pandas as pd
+from app import db
+from app.models.debt import DebtCase
+from app.models.ai_prediction import AIModelPrediction
+from app.models.case_closure import CaseClosure
+from app.utils.sql import row_dicts
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = 2000
+
+# File formats of write_export; NDJSON is streamed by iter_ndjson instead
+EXPORT_FORMATS = ("csv", "parquet")
+
+# Every case column of the exports and the case listings, in export order.
+# Each one's key (its label where renamed) is its field in the output.
+CASE_COLUMNS = (
+    DebtCase.id,
+    DebtCase.tracking_number,
+    DebtCase.customer_name,
+    DebtCase.amount_due,
+    DebtCase.due_date,
+    DebtCase.aging_days,
+    DebtCase.aging_bucket,
+    DebtCase.status,
+    DebtCase.created_at,
+    AIModelPrediction.model_version,
+    AIModelPrediction.predicted_recovery_probability.label("recovery_probability"),
+    AIModelPrediction.priority_score,
+    AIModelPrediction.predicted_at,
+    CaseClosure.recovered_amount,
+    CaseClosure.closure_reason,
+    CaseClosure.closed_at
+)
+EXPORT_FIELDS = [column.key for column in CASE_COLUMNS]
+_COLUMNS_BY_FIELD = dict(zip(EXPORT_FIELDS, CASE_COLUMNS))
+
+
+def case_columns(*fields):
+    """The ``CASE_COLUMNS`` of ``fields``, in that order."""
+    return [_COLUMNS_BY_FIELD[field] for field in fields]
+
+
+def export_query(filters):
+    return (
+        db.select(*CASE_COLUMNS)
+        .select_from(DebtCase)
+        .outerjoin(AIModelPrediction, AIModelPrediction.case_id == DebtCase.id)
+        .outerjoin(CaseClosure, CaseClosure.case_id == DebtCase.id)
+        .where(*filters)
+        .order_by(DebtCase.id)
+    )
+
+
+def iter_case_batches(filters, batch_size=EXPORT_BATCH_SIZE):
+    """Yield lists of export row tuples, ``batch_size`` at a time.
+
+    ``yield_per`` streams from a server-side cursor on Postgres, so only
+    one batch is ever held in memory however large the tenant is.
+    """
+    result = db.session.execute(
+        export_query(filters),
+        execution_options={"yield_per": batch_size}
+    )
+    for batch in result.partitions():
+        yield batch
+
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def iter_ndjson(filters, batch_size=EXPORT_BATCH_SIZE):
+    """Export rows as newline-delimited JSON, one chunk of text per batch."""
+    for batch in iter_case_batches(filters, batch_size):
+        yield "".join(
+            json.dumps(item, default=_json_default) + "\n"
+            for item in row_dicts(CASE_COLUMNS, batch)
+        )
+
+
+def _write_csv(path, batches):
+    rows = 0
+    with open(path, "w", newline="") as f:
+        for index, batch in enumerate(batches):
+            pd.DataFrame.from_records(batch, columns=EXPORT_FIELDS).to_csv(
+                f, header=index == 0, index=False
+            )
+            rows += len(batch)
+        if rows == 0:
+            f.write(",".join(EXPORT_FIELDS) + "\n")
+    return rows
+
+
+def _parquet_schema(pa):
+    return pa.schema([
+        ("id", pa.int64()),
+        ("tracking_number", pa.string()),
+        ("customer_name", pa.string()),
+        ("amount_due", pa.float64()),
+        ("due_date", pa.date32()),
+        ("aging_days", pa.int64()),
+        ("aging_bucket", pa.string()),
+        ("status", pa.string()),
+        ("created_at", pa.timestamp("us")),
+        ("model_version", pa.string()),
+        ("recovery_probability", pa.float64()),
+        ("priority_score", pa.float64()),
+        ("predicted_at", pa.timestamp("us")),
+        ("recovered_amount", pa.float64()),
+        ("closure_reason", pa.string()),
+        ("closed_at", pa.timestamp("us"))
+    ])
+
+
+def _write_parquet(path, batches):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Parquet export needs pyarrow installed")
+
+    # one row group per batch, typed up front so all-NULL batches still fit
+    schema = _parquet_schema(pa)
+    rows = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for batch in batches:
+            columns = list(zip(*batch))
+            writer.write_batch(pa.RecordBatch.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                schema=schema
+            ))
+            rows += len(batch)
+    return rows
+
+
+def write_export(path, fmt, filters, batch_size=EXPORT_BATCH_SIZE):
+    """Write the export of ``filters`` to ``path`` as CSV or Parquet.
+
+    Batches go from the DB cursor straight to the file, so neither the
+    rows nor the output are ever held in memory whole. Returns the row
+    count; raises ``ValueError`` for an unknown format or missing pyarrow.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    batches = iter_case_batches(filters, batch_size)
+    if fmt == "csv":
+        return _write_csv(path, batches)
+    return _write_parquet(path, batches)
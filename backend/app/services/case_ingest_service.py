@@ -0,0 +1,278 @@
+from datetime import date, datetime
+import hashlib
+import time
+import numpy as np
+import pandas as pd
+from app import db
+from app.models.debt import DebtCase
+from app.models.audit_log import AuditLog
+from app.services.ai_prediction_service import (
+    MODEL_VERSION,
+    bulk_upsert_predictions,
+    score_cases
+)
+from app.services.recovery_rate_service import historical_recovery_rate
+from app.services.overview_service import invalidate_overview
+from app.services.case_counter_service import record_new_cases
+from app.services.case_validation_service import (
+    MAX_REPORTED_ROWS,
+    error_report,
+    missing_columns,
+    validate_cases
+)
+from app.utils.sql import dialect_insert
+
+AGING_BINS = [-np.inf, 30, 60, 90, np.inf]
+AGING_LABELS = ["0-30", "31-60", "61-90", "90+"]
+
+# Keeps the IN (...) list of the duplicate lookup well under the
+# bind-parameter limits of Postgres and SQLite.
+LOOKUP_BATCH_SIZE = 5000
+
+
+def read_upload(file):
+    # tracking numbers are identifiers, never let pandas turn them into ints
+    if file.filename.endswith(".csv"):
+        return pd.read_csv(file, dtype={"tracking_number": str})
+    return pd.read_excel(file, dtype={"tracking_number": str})
+
+
+def read_columns(file):
+    """Header of an uploaded file, leaving ``file`` rewound for the real read."""
+    if file.filename.endswith(".csv"):
+        columns = pd.read_csv(file, nrows=0).columns
+    else:
+        columns = pd.read_excel(file, nrows=0).columns
+    file.seek(0)
+    return list(columns)
+
+
+def compute_aging(due_dates, today=None):
+    """Days past due as of ``today`` and their ``AGING_LABELS`` bucket, for
+    a whole column of due dates.
+
+    Returns ``(parsed_dates, aging_days, aging_buckets)``; unparseable or
+    missing dates yield missing values in all three.
+    """
+    today = pd.Timestamp(today or date.today())
+    parsed = pd.to_datetime(due_dates, format="%Y-%m-%d", errors="coerce")
+
+    aging_days = (today - parsed).dt.days.astype("Int64")
+    aging_buckets = pd.cut(
+        aging_days.astype(float),
+        bins=AGING_BINS,
+        labels=AGING_LABELS
+    )
+
+    return parsed, aging_days, aging_buckets
+
+
+def existing_tracking_numbers(tracking_numbers):
+    existing = set()
+    values = list(tracking_numbers)
+
+    for start in range(0, len(values), LOOKUP_BATCH_SIZE):
+        batch = values[start:start + LOOKUP_BATCH_SIZE]
+        existing.update(
+            db.session.scalars(
+                db.select(DebtCase.tracking_number)
+                .where(DebtCase.tracking_number.in_(batch))
+            )
+        )
+
+    return existing
+
+
+def _column(series):
+    # DB drivers want plain Python objects with None for missing values
+    return [None if pd.isna(v) else v for v in series.astype(object).tolist()]
+
+
+def ingest_cases(df, enterprise_id):
+    """Insert every new row of ``df`` as a scored ``DebtCase``.
+
+    ``df`` is expected to have passed ``validate_cases``.
+    Dedupe, aging and scoring are computed over whole columns, then cases
+    are written with one bulk INSERT and predictions with
+    ``bulk_upsert_predictions``. Nothing is committed here, so the caller
+    controls the transaction.
+
+    Returns ``(rows_created, rows_skipped)``.
+    """
+    total = len(df)
+
+    df = df.assign(tracking_number=df["tracking_number"].astype(str).str.strip())
+    df = df.drop_duplicates(subset="tracking_number", keep="first")
+
+    existing = existing_tracking_numbers(df["tracking_number"])
+    df = df[~df["tracking_number"].isin(existing)]
+
+    if df.empty:
+        return 0, total
+
+    parsed, aging_days, aging_buckets = compute_aging(df["due_date"])
+    due_dates = parsed.dt.date
+
+    records = [
+        {
+            "tracking_number": tracking_number,
+            "customer_name": customer_name,
+            "amount_due": amount_due,
+            "due_date": due_date,
+            "aging_days": days,
+            "aging_bucket": bucket,
+            "status": "NEW",
+            "enterprise_id": enterprise_id
+        }
+        for tracking_number, customer_name, amount_due, due_date, days, bucket in zip(
+            _column(df["tracking_number"]),
+            _column(df["customer_name"]),
+            _column(df["amount_due"].astype(float)),
+            _column(due_dates),
+            _column(aging_days),
+            _column(aging_buckets)
+        )
+    ]
+
+    # freshly inserted cases have no escalations yet; scored up front so
+    # priority_sort goes in with the INSERT
+    recovery, priority = score_cases(
+        [r["aging_bucket"] for r in records],
+        [r["amount_due"] for r in records],
+        np.zeros(len(records)),
+        historical_recovery_rate(enterprise_id)
+    )
+    recovery_by_number = {}
+    for r, p_recovery, p_priority in zip(records, recovery, priority):
+        r["priority_sort"] = float(p_priority)
+        recovery_by_number[r["tracking_number"]] = float(p_recovery)
+
+    # DO NOTHING covers rows another upload inserted since the lookup above
+    insert = dialect_insert()
+    case_ids = dict(
+        db.session.execute(
+            insert(DebtCase)
+            .on_conflict_do_nothing(index_elements=[DebtCase.tracking_number])
+            .returning(DebtCase.tracking_number, DebtCase.id),
+            records
+        ).all()
+    )
+    record_new_cases(enterprise_id, len(case_ids))
+
+    bulk_upsert_predictions([
+        {
+            "case_id": case_ids[r["tracking_number"]],
+            "model_version": MODEL_VERSION,
+            "predicted_recovery_probability": recovery_by_number[r["tracking_number"]],
+            "priority_score": r["priority_sort"]
+        }
+        for r in records
+        if r["tracking_number"] in case_ids
+    ], sync_priority_sort=False)
+
+    return len(case_ids), total - len(case_ids)
+
+
+def file_checksum(file):
+    digest = hashlib.sha256()
+    for block in iter(lambda: file.read(1 << 20), b""):
+        digest.update(block)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def iter_upload_chunks(source, filename, chunk_size):
+    if filename.endswith(".csv"):
+        yield from pd.read_csv(
+            source,
+            dtype={"tracking_number": str},
+            chunksize=chunk_size
+        )
+        return
+
+    # pandas cannot stream Excel, the workbook is loaded once and sliced
+    df = pd.read_excel(source, dtype={"tracking_number": str})
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start:start + chunk_size]
+
+
+def ingest_upload_in_chunks(upload, source):
+    """Feed an upload into ``ingest_cases`` ``upload.chunk_size`` rows at a time.
+
+    Each chunk is committed together with the progress counters on
+    ``upload`` (a ``CaseUpload``), so a CSV only ever has one chunk in
+    memory and a failed run can be retried with the same file: chunks below
+    ``upload.chunks_committed`` are read past without touching the DB.
+    """
+    chunks = iter_upload_chunks(source, upload.filename, upload.chunk_size)
+
+    try:
+        for index, chunk in enumerate(chunks):
+            if index < upload.chunks_committed:
+                continue
+
+            missing = missing_columns(chunk.columns)
+            if missing:
+                raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+            clean, errors = validate_cases(chunk)
+            created, skipped = ingest_cases(clean, upload.enterprise_id)
+
+            upload.chunks_committed = index + 1
+            upload.rows_processed += len(chunk)
+            upload.rows_created += created
+            upload.rows_skipped += skipped
+            if errors:
+                reported = upload.validation_errors or []
+                upload.rows_invalid += len(errors)
+                upload.validation_errors = (
+                    reported + error_report(errors)["errors"]
+                )[:MAX_REPORTED_ROWS]
+            db.session.commit()
+            invalidate_overview(upload.enterprise_id)
+    except Exception as exc:
+        db.session.rollback()
+        upload.status = "FAILED"
+        upload.error = str(exc)[:2000]
+        db.session.commit()
+        raise
+
+    upload.status = "COMPLETED"
+    upload.completed_at = datetime.utcnow()
+
+
+def run_upload(upload, source):
+    """Run (or resume) ``upload`` to completion and audit it.
+
+    Raises whatever ``ingest_upload_in_chunks`` raised, after the upload
+    has been marked FAILED with the progress made so far.
+    """
+    upload.status = "RUNNING"
+    upload.error = None
+    db.session.commit()
+
+    started = time.perf_counter()
+    resumed_from = upload.rows_processed
+
+    ingest_upload_in_chunks(upload, source)
+
+    elapsed = time.perf_counter() - started
+    rows = upload.rows_processed - resumed_from
+
+    db.session.add(AuditLog(
+        entity_type="CaseUpload",
+        entity_id=str(upload.id),
+        action="BULK_UPLOAD",
+        performed_by=upload.uploaded_by,
+        performed_at=datetime.utcnow(),
+        audit_metadata={
+            "rows_created": upload.rows_created,
+            "rows_skipped": upload.rows_skipped,
+            "rows_invalid": upload.rows_invalid,
+            "chunks": upload.chunks_committed,
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(rows / elapsed, 1) if elapsed else None
+        }
+    ))
+
+    db.session.commit()
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+REQUIRED_COLUMNS = ("tracking_number", "customer_name", "amount_due", "due_date")
+
+DUE_DATE_FORMAT = "%Y-%m-%d"
+
+# Invalid rows listed in a report; the totals always cover every row
+MAX_REPORTED_ROWS = 100
+
+# First data row of an upload is line 2 of the file, after the header
+HEADER_LINES = 1
+
+
+def missing_columns(columns):
+    return [c for c in REQUIRED_COLUMNS if c not in columns]
+
+
+def _blank(series):
+    return series.isna() | series.astype(str).str.strip().eq("")
+
+
+def validate_cases(df):
+    """Check a whole upload frame before anything touches the DB.
+
+    Every check runs over full columns. Returns ``(clean_df, errors)``:
+    ``clean_df`` holds the valid rows with ``tracking_number`` stripped and
+    ``amount_due`` numeric, ``errors`` maps each invalid row's file line
+    number to its messages, in file order. Required columns must be
+    present, see ``missing_columns``.
+    """
+    tracking_numbers = df["tracking_number"].astype("string").str.strip()
+    amounts = pd.to_numeric(df["amount_due"], errors="coerce")
+    due_dates = pd.to_datetime(df["due_date"], format=DUE_DATE_FORMAT, errors="coerce")
+
+    missing_tracking = tracking_numbers.isna() | tracking_numbers.eq("")
+    duplicate = tracking_numbers.duplicated(keep="first") & ~missing_tracking
+    missing_customer = _blank(df["customer_name"])
+    missing_amount = _blank(df["amount_due"])
+    missing_due_date = _blank(df["due_date"])
+
+    checks = (
+        (missing_tracking, "tracking_number is required"),
+        (duplicate, "tracking_number is duplicated in the file"),
+        (missing_customer, "customer_name is required"),
+        (missing_amount, "amount_due is required"),
+        (amounts.isna() & ~missing_amount, "amount_due is not a number"),
+        (amounts.lt(0), "amount_due is negative"),
+        (missing_due_date, "due_date is required"),
+        (due_dates.isna() & ~missing_due_date, "due_date is not a YYYY-MM-DD date")
+    )
+
+    invalid = np.zeros(len(df), dtype=bool)
+    for mask, _ in checks:
+        invalid |= mask.fillna(False).to_numpy(dtype=bool)
+
+    errors = {}
+    if invalid.any():
+        lines = df.index.to_numpy() + HEADER_LINES + 1
+        for mask, message in checks:
+            for line in lines[mask.fillna(False).to_numpy(dtype=bool)]:
+                errors.setdefault(int(line), []).append(message)
+        errors = dict(sorted(errors.items()))
+
+    clean = df.assign(tracking_number=tracking_numbers, amount_due=amounts)[~invalid]
+    return clean, errors
+
+
+def error_report(errors, limit=MAX_REPORTED_ROWS):
+    """Compact JSON form of ``validate_cases`` errors, capped at ``limit`` rows."""
+    return {
+        "invalid_rows": len(errors),
+        "errors": [
+            {"row": line, "errors": messages}
+            for line, messages in list(errors.items())[:limit]
+        ],
+        "truncated": len(errors) > limit
+    }
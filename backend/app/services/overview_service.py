@@ -0,0 +1,64 @@
+import time
+from threading import Lock
+from flask import current_app
+from app.models.debt import CLOSED_STATUSES
+from app.services.case_counter_service import stored_status_counts
+
+# Overview bucket of each case status; every case also counts in total_overdue
+OVERVIEW_BUCKETS = {
+    "NEW": "in_progress",
+    "PENDING": "in_progress",
+    "ESCALATED": "escalated",
+    **{status: "closed" for status in CLOSED_STATUSES}
+}
+
+# {enterprise_id: (expires_at, overview)}, local to this process
+_cache = {}
+# {enterprise_id: invalidation count}, so a read that raced a write is not cached
+_generations = {}
+_cache_lock = Lock()
+
+
+def overview_from_counts(counts):
+    """Overview response from ``{status: case_count}``."""
+    overview = {
+        "total_overdue": sum(counts.values()),
+        "in_progress": 0,
+        "escalated": 0,
+        "closed": 0
+    }
+    for status, count in counts.items():
+        bucket = OVERVIEW_BUCKETS.get(status)
+        if bucket:
+            overview[bucket] += count
+    return overview
+
+
+def cached_overview(enterprise_id):
+    """Cached overview of one enterprise, rebuilt from ``case_status_counts``
+    once the TTL runs out.
+
+    Case writes call ``invalidate_overview`` after committing. The cache is
+    per process, other workers catch up within ``OVERVIEW_CACHE_TTL``.
+    """
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _cache.get(enterprise_id)
+        generation = _generations.get(enterprise_id, 0)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    overview = overview_from_counts(stored_status_counts(enterprise_id))
+
+    ttl = current_app.config["OVERVIEW_CACHE_TTL"]
+    with _cache_lock:
+        if ttl > 0 and _generations.get(enterprise_id, 0) == generation:
+            _cache[enterprise_id] = (now + ttl, overview)
+    return overview
+
+
+def invalidate_overview(*enterprise_ids):
+    with _cache_lock:
+        for enterprise_id in enterprise_ids:
+            _cache.pop(enterprise_id, None)
+            _generations[enterprise_id] = _generations.get(enterprise_id, 0) + 1
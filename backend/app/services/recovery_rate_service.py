@@ -0,0 +1,153 @@
+from datetime import datetime
+from sqlalchemy import func
+from app import db
+from app.models.debt import DebtCase
+from app.models.case_closure import CaseClosure
+from app.models.recovery_rate import RecoveryRateAggregate, GLOBAL_SCOPE
+from app.utils.sql import dialect_insert
+
+DEFAULT_RECOVERY_RATE = 0.4
+
+SUM_COLUMNS = ("closure_count", "recovered_total", "due_total", "ratio_total")
+
+
+def _increment(rows):
+    insert = dialect_insert()
+    stmt = insert(RecoveryRateAggregate)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[RecoveryRateAggregate.enterprise_id],
+        set_={
+            **{
+                column: getattr(RecoveryRateAggregate, column) + stmt.excluded[column]
+                for column in SUM_COLUMNS
+            },
+            "updated_at": stmt.excluded.updated_at
+        }
+    )
+    db.session.execute(stmt, rows)
+
+
+def record_closure(enterprise_id, recovered_amount, amount_due):
+    """Add one ``CaseClosure`` to the enterprise and global aggregates.
+
+    Runs in the caller's transaction, so the sums move together with the
+    closure row. Closures the old ``AVG(recovered / due)`` skipped (no
+    recovered amount, nothing due) are skipped here too.
+    """
+    if recovered_amount is None or not amount_due:
+        return
+
+    delta = {
+        "closure_count": 1,
+        "recovered_total": float(recovered_amount),
+        "due_total": float(amount_due),
+        "ratio_total": float(recovered_amount) / float(amount_due),
+        "updated_at": datetime.utcnow()
+    }
+
+    scopes = [GLOBAL_SCOPE]
+    if enterprise_id is not None:
+        scopes.append(enterprise_id)
+
+    _increment([{"enterprise_id": scope, **delta} for scope in scopes])
+
+
+def _rate(aggregate):
+    if not aggregate or not aggregate.closure_count:
+        return None
+    return aggregate.ratio_total / aggregate.closure_count
+
+
+def recovery_rates(enterprise_ids):
+    """Historical recovery rate per enterprise id, read from the aggregates.
+
+    An enterprise without closures of its own gets the global rate, and
+    the global rate falls back to ``DEFAULT_RECOVERY_RATE``.
+    """
+    enterprise_ids = set(enterprise_ids)
+    aggregates = {
+        a.enterprise_id: a
+        for a in RecoveryRateAggregate.query.filter(
+            RecoveryRateAggregate.enterprise_id.in_(
+                {GLOBAL_SCOPE} | (enterprise_ids - {None})
+            )
+        )
+    }
+
+    global_rate = _rate(aggregates.get(GLOBAL_SCOPE)) or DEFAULT_RECOVERY_RATE
+
+    return {
+        enterprise_id: _rate(aggregates.get(enterprise_id)) or global_rate
+        for enterprise_id in enterprise_ids
+    }
+
+
+def historical_recovery_rate(enterprise_id=None):
+    return recovery_rates([enterprise_id])[enterprise_id]
+
+
+def compute_recovery_aggregates():
+    """Recompute every aggregate from ``case_closures``, keyed by enterprise id."""
+    ratio = CaseClosure.recovered_amount / DebtCase.amount_due
+    columns = (
+        func.count(CaseClosure.id),
+        func.coalesce(func.sum(CaseClosure.recovered_amount), 0),
+        func.coalesce(func.sum(DebtCase.amount_due), 0),
+        func.coalesce(func.sum(ratio), 0)
+    )
+    contributing = (
+        CaseClosure.recovered_amount.isnot(None),
+        DebtCase.amount_due != 0
+    )
+
+    per_enterprise = (
+        db.session.query(DebtCase.enterprise_id, *columns)
+        .join(DebtCase, DebtCase.id == CaseClosure.case_id)
+        .filter(*contributing, DebtCase.enterprise_id.isnot(None))
+        .group_by(DebtCase.enterprise_id)
+        .all()
+    )
+    overall = (
+        db.session.query(*columns)
+        .join(DebtCase, DebtCase.id == CaseClosure.case_id)
+        .filter(*contributing)
+        .one()
+    )
+
+    return {
+        enterprise_id: dict(zip(SUM_COLUMNS, sums))
+        for enterprise_id, *sums in [(GLOBAL_SCOPE, *overall), *per_enterprise]
+        if sums[0]
+    }
+
+
+def rebuild_recovery_aggregates(dry_run=False):
+    """Replace the stored aggregates with a fresh recomputation.
+
+    Returns ``{enterprise_id: (stored_rate, recomputed_rate)}`` for every
+    scope whose stored rate drifted, so the command can report it.
+    """
+    recomputed = compute_recovery_aggregates()
+    stored = {a.enterprise_id: a for a in RecoveryRateAggregate.query.all()}
+
+    drift = {}
+    for enterprise_id in set(stored) | set(recomputed):
+        sums = recomputed.get(enterprise_id)
+        new_rate = sums["ratio_total"] / sums["closure_count"] if sums else None
+        old_rate = _rate(stored.get(enterprise_id))
+        if old_rate is None or new_rate is None:
+            drifted = old_rate != new_rate
+        else:
+            drifted = abs(old_rate - new_rate) > 1e-9
+        if drifted:
+            drift[enterprise_id] = (old_rate, new_rate)
+
+    if not dry_run:
+        RecoveryRateAggregate.query.delete()
+        db.session.add_all(
+            RecoveryRateAggregate(enterprise_id=enterprise_id, **sums)
+            for enterprise_id, sums in recomputed.items()
+        )
+        db.session.commit()
+
+    return drift
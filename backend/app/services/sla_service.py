@@ -1,7 +1,126 @@
+import json
+import queue
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
 from app import db
-from app.models.all_models import CaseSLATracking
+from app.models.all_models import CaseSLATracking, DebtCase
 from app.models.all_models import AuditLog
-from datetime import datetime
+from datetime import datetime, timedelta
+
+# Postgres NOTIFY channel the SLA daemon listens on
+SLA_EVENTS_CHANNEL = "sla_events"
+
+# Stand-in for LISTEN/NOTIFY on other databases, read by an in-process daemon.
+# Bounded: when no daemon drains it, events are dropped and the daemon's
+# periodic reload from case_sla_tracking catches up instead.
+LOCAL_EVENTS_LIMIT = 10000
+local_sla_events = queue.Queue(maxsize=LOCAL_EVENTS_LIMIT)
+
+
+def publish_sla_event(kind, case_id, due_at=None, warn_at=None):
+    """Tell the SLA daemon an SLA ``"started"`` or ``"completed"``.
+
+    The event is only delivered if the current transaction commits: NOTIFY
+    is transactional on Postgres, elsewhere it is queued on commit.
+    """
+    payload = json.dumps({
+        "event": kind,
+        "case_id": case_id,
+        "due_at": due_at.isoformat() if due_at else None,
+        "warn_at": warn_at.isoformat() if warn_at else None
+    })
+    if db.session.get_bind().dialect.name == "postgresql":
+        db.session.execute(db.select(func.pg_notify(SLA_EVENTS_CHANNEL, payload)))
+    else:
+        db.session.info.setdefault("sla_events", []).append(payload)
+
+
+@event.listens_for(Session, "after_commit")
+def _queue_local_sla_events(session):
+    for payload in session.info.pop("sla_events", []):
+        try:
+            local_sla_events.put_nowait(payload)
+        except queue.Full:
+            break
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_local_sla_events(session):
+    session.info.pop("sla_events", None)
+
+
+def start_sla(case_id, sla_definition, started_at=None):
+    """Add a RUNNING SLA for ``case_id`` with its deadline stored in ``due_at``."""
+    started_at = started_at or datetime.utcnow()
+    sla = CaseSLATracking(
+        case_id=case_id,
+        sla_definition_id=sla_definition.id,
+        started_at=started_at,
+        due_at=started_at + timedelta(hours=sla_definition.max_resolution_hours),
+        status="RUNNING"
+    )
+    if sla_definition.escalation_threshold_hours is not None:
+        sla.warn_at = started_at + timedelta(hours=sla_definition.escalation_threshold_hours)
+    db.session.add(sla)
+    publish_sla_event("started", case_id, sla.due_at, sla.warn_at)
+    return sla
+
+
+def _first(column, *conditions):
+    return db.session.scalar(
+        db.select(column).where(*conditions, column.isnot(None)).order_by(column).limit(1)
+    )
+
+
+def next_sla_deadline():
+    """Earliest ``due_at`` or pending ``warn_at`` of the running SLAs,
+    ``None`` when none run.
+
+    Reads the first entry of each partial index.
+    """
+    times = [
+        _first(CaseSLATracking.due_at, CaseSLATracking.status == "RUNNING"),
+        _first(CaseSLATracking.warn_at, CaseSLATracking.status == "RUNNING", CaseSLATracking.warned_at.is_(None))
+    ]
+    times = [t for t in times if t is not None]
+    return min(times) if times else None
+
+
+def upcoming_sla_deadlines(until, limit):
+    """``(case_id, due_at)`` of the running SLAs due before ``until``,
+    soonest first and at most ``limit`` of them."""
+    return db.session.execute(
+        db.select(CaseSLATracking.case_id, CaseSLATracking.due_at)
+        .where(CaseSLATracking.status == "RUNNING", CaseSLATracking.due_at < until)
+        .order_by(CaseSLATracking.due_at)
+        .limit(limit)
+    ).all()
+
+
+def upcoming_sla_warnings(until, limit):
+    """``(case_id, warn_at)`` of the running, not yet warned SLAs reaching
+    their escalation threshold before ``until``, soonest first."""
+    return db.session.execute(
+        db.select(CaseSLATracking.case_id, CaseSLATracking.warn_at)
+        .where(
+            CaseSLATracking.status == "RUNNING",
+            CaseSLATracking.warned_at.is_(None),
+            CaseSLATracking.warn_at < until
+        )
+        .order_by(CaseSLATracking.warn_at)
+        .limit(limit)
+    ).all()
+
+
+def sla_status_totals(enterprise_id):
+    """``{status: sla_count}`` of an enterprise, one GROUP BY."""
+    return dict(db.session.execute(
+        db.select(CaseSLATracking.status, func.count())
+        .join(DebtCase, DebtCase.id == CaseSLATracking.case_id)
+        .where(DebtCase.enterprise_id == enterprise_id, CaseSLATracking.status.isnot(None))
+        .group_by(CaseSLATracking.status)
+    ).all())
+
 
 def sla_if_running(case_id):
     sla = CaseSLATracking.query.filter_by(
@@ -12,6 +131,7 @@ def sla_if_running(case_id):
     if sla:
         sla.status = "COMPLETED"
         db.session.add(sla)
+        publish_sla_event("completed", case_id)
 
         # ✅ Audit log
         db.session.add(AuditLog(
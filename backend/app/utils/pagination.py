@@ -0,0 +1,88 @@
+import base64
+from datetime import datetime
+import json
+from sqlalchemy import tuple_
+from app import db
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def page_size(requested):
+    if not requested or requested < 1:
+        return DEFAULT_PAGE_SIZE
+    return min(requested, MAX_PAGE_SIZE)
+
+
+def encode_cursor(values):
+    values = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Values packed by ``encode_cursor``; raises ``ValueError`` if mangled."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def cursor_value(column, value):
+    """Cursor ``value`` as the Python type of ``column``; raises
+    ``ValueError`` unless it is a scalar of that type."""
+    python_type = column.type.python_type
+    if python_type is datetime and isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    elif python_type is float and type(value) in (int, float):
+        return value
+    elif python_type in (int, str) and type(value) is python_type:
+        return value
+    raise ValueError("Invalid cursor")
+
+
+def after(columns, values, descending):
+    """Keyset condition for the rows following ``values`` in ``columns`` order."""
+    key = tuple_(*columns)
+    bound = tuple_(*values)
+    return key < bound if descending else key > bound
+
+
+def order_by(columns, descending):
+    return [c.desc() if descending else c.asc() for c in columns]
+
+
+def keyset_page(query, sort, order, sort_key, id_column, cursor=None, limit=None):
+    """Run one page of ``query`` ordered by ``(sort_key, id_column)``.
+
+    ``sort``/``order`` name the ordering and are packed into the cursor, so
+    a cursor is only accepted back with the same ones. Returns ``(rows,
+    next_cursor)``; raises ``ValueError`` for a bad cursor.
+    """
+    keyset = (sort_key, id_column)
+    descending = order == "desc"
+    limit = page_size(limit)
+
+    query = query.add_columns(sort_key.label("sort_key"), id_column.label("sort_id"))
+
+    if cursor:
+        values = decode_cursor(cursor)
+        if values[:2] != [sort, order] or len(values) != 2 + len(keyset):
+            raise ValueError("Cursor does not match sort and order")
+        values = [cursor_value(column, value) for column, value in zip(keyset, values[2:])]
+        query = query.where(after(keyset, values, descending))
+
+    rows = db.session.execute(
+        query.order_by(*order_by(keyset, descending)).limit(limit + 1)
+    ).all()
+
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    return rows, encode_cursor([sort, order, rows[-1].sort_key, rows[-1].sort_id])
@@ -0,0 +1,30 @@
+from sqlalchemy import Date, Integer, cast, func, literal
+from app import db
+
+
+def dialect_insert():
+    """``insert()`` of the bound dialect, for ``on_conflict_do_update`` upserts.
+
+    Postgres in production, SQLite for local runs; both expose the same
+    ``ON CONFLICT`` API.
+    """
+    if db.session.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+def days_since(day, date_column):
+    """SQL integer ``day - date_column`` in days, ``day`` bound as a parameter."""
+    if db.session.get_bind().dialect.name == "postgresql":
+        return literal(day, Date) - date_column
+
+    return cast(func.julianday(literal(day, Date)) - func.julianday(date_column), Integer)
+
+
+def row_dicts(columns, rows):
+    """``rows`` as dicts keyed by the ``key`` of each of ``columns``, which
+    select the leading values of every row."""
+    keys = [column.key for column in columns]
+    return [dict(zip(keys, row)) for row in rows]
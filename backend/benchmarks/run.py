@@ -0,0 +1,248 @@
+"""Ingest and scoring benchmarks, run from the backend directory:
+
+    python -m benchmarks.run --sizes 10000,100000 --output bench.json
+    python -m benchmarks.run --db postgresql://user:pw@localhost/bench --sizes 1000000
+
+Every size gets a fresh synthetic tenant. Without --db each size runs
+against its own SQLite file; with --db the tables are created if missing
+and the data is added next to whatever is there, so point it at a
+scratch database.
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime
+import numpy as np
+from sqlalchemy import event
+from app import create_app, db
+from app.models.debt import DebtCase
+from app.models.case_assignment import CaseAssignment
+from app.jobs.sla_breach_checker import check_sla_breaches, check_sla_warnings
+from app.services.ai_prediction_service import generate_prediction
+from benchmarks.synthetic import (
+    seed_organizations,
+    seed_sla_definition,
+    write_cases_file,
+    seed_activity
+)
+
+LIST_ENDPOINTS = (
+    ("enterprise", "/api/enterprise/cases"),
+    ("enterprise", "/api/enterprise/overview"),
+    ("enterprise", "/api/enterprise/sla/status"),
+    ("enterprise", "/api/enterprise/sla/at-risk"),
+    ("enterprise", "/api/enterprise/escalations/pending"),
+    ("dca", "/api/dca/cases")
+)
+
+
+class StatementCounter:
+    """Counts the SQL statements the engine executes from ``start()`` on,
+    or inside a ``with`` block, which starts the count from zero."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+    def start(self):
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def stop(self):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+    def __enter__(self):
+        self.count = 0
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def summarize(latencies, items, statements):
+    """Report entry for one operation: ``latencies`` in seconds, ``items``
+    the number of rows/cases the operation handled in total."""
+    total = sum(latencies)
+    return {
+        "calls": len(latencies),
+        "items": items,
+        "total_seconds": round(total, 4),
+        "throughput_per_second": round(items / total, 1) if total else None,
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(float(np.percentile(latencies, 99)) * 1000, 2),
+        "sql_statements": statements
+    }
+
+
+def measure(counter, operation, calls=1):
+    """Run ``operation`` ``calls`` times; returns ``(latencies, statements)``.
+
+    ``operation`` raises if the call it benchmarks did not succeed.
+    """
+    before = counter.count
+    latencies = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - started)
+    return latencies, counter.count - before
+
+
+def login(app, email):
+    client = app.test_client()
+    response = client.post("/api/auth/login", json={"email": email})
+    assert response.status_code == 200, response.data
+    return client
+
+
+def expect_ok(response):
+    assert response.status_code < 400, (response.status_code, response.data[:500])
+    return response
+
+
+def run_size(database_uri, size, workdir, args):
+    """Benchmark one dataset size; returns its report entry.
+
+    HTTP calls go through the test client outside of any app context, like
+    real requests; direct service calls run in their own app context.
+    """
+    app = create_app({"SQLALCHEMY_DATABASE_URI": database_uri})
+    prefix = f"bench{size}-{uuid.uuid4().hex[:6]}"
+    report = {"size": size}
+
+    with app.app_context():
+        db.create_all()
+        counter = StatementCounter(db.engine).start()
+
+        (enterprise_user,), dca_users = seed_organizations(prefix, dcas=args.dcas)
+        enterprise_id = enterprise_user.organization_id
+        enterprise_user_id = enterprise_user.id
+        enterprise_email = enterprise_user.email
+        dca_email = dca_users[0].email
+        dca_ids = [u.organization_id for u in dca_users]
+        sla_id = seed_sla_definition().id
+
+    enterprise_client = login(app, enterprise_email)
+    dca_client = login(app, dca_email)
+
+    # ---- upload_cases ----
+    path = write_cases_file(os.path.join(workdir, f"{prefix}.{args.format}"), size, prefix)
+
+    def upload():
+        with open(path, "rb") as f:
+            expect_ok(enterprise_client.post(
+                "/api/enterprise/cases/upload?mode=sync",
+                data={"file": (f, os.path.basename(path))},
+                content_type="multipart/form-data"
+            ))
+
+    latencies, statements = measure(counter, upload)
+    report["upload_cases"] = summarize(latencies, size, statements)
+
+    # ---- generate_prediction ----
+    with app.app_context():
+        sample = DebtCase.query.filter_by(enterprise_id=enterprise_id).limit(args.samples).all()
+        cases = iter(sample)
+        latencies, statements = measure(counter, lambda: generate_prediction(next(cases)), len(sample))
+        report["generate_prediction"] = summarize(latencies, len(sample), statements)
+
+    # ---- assign_cases ----
+    with app.app_context():
+        activity = seed_activity(enterprise_id, dca_ids, enterprise_user_id, sla_id)
+        report["seeded"] = activity
+
+        unassigned = db.session.scalars(
+            db.select(DebtCase.id)
+            .where(
+                DebtCase.enterprise_id == enterprise_id,
+                DebtCase.id.notin_(db.select(CaseAssignment.case_id))
+            )
+            .limit(args.assign_batch * args.assign_calls)
+        ).all()
+
+    batches = iter([
+        unassigned[i:i + args.assign_batch]
+        for i in range(0, len(unassigned), args.assign_batch)
+    ])
+    latencies, statements = measure(
+        counter,
+        lambda: expect_ok(enterprise_client.post(
+            "/api/enterprise/assign",
+            json={"case_ids": next(batches), "dca_id": dca_ids[0]}
+        )),
+        -(-len(unassigned) // args.assign_batch)
+    )
+    report["assign_cases"] = summarize(latencies, len(unassigned), statements)
+
+    # ---- check_sla_breaches ----
+    with app.app_context():
+        latencies, statements = measure(counter, check_sla_breaches)
+        report["check_sla_breaches"] = summarize(latencies, activity["assigned"], statements)
+        latencies, statements = measure(counter, check_sla_warnings)
+        report["check_sla_warnings"] = summarize(latencies, activity["assigned"], statements)
+
+    # ---- list endpoints ----
+    clients = {"enterprise": enterprise_client, "dca": dca_client}
+    for who, url in LIST_ENDPOINTS:
+        latencies, statements = measure(
+            counter,
+            lambda: expect_ok(clients[who].get(url)),
+            args.repeat
+        )
+        report[f"GET {url}"] = summarize(latencies, args.repeat, statements)
+
+    with app.app_context():
+        db.engine.dispose()
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark case ingest, scoring and listing.")
+    parser.add_argument("--db", help="Database URL (default: a fresh SQLite file per size).")
+    parser.add_argument("--sizes", default="10000", help="Comma separated case counts, e.g. 10000,100000,1000000.")
+    parser.add_argument("--format", choices=["csv", "xlsx"], default="csv", help="Upload file format.")
+    parser.add_argument("--dcas", type=int, default=3)
+    parser.add_argument("--samples", type=int, default=200, help="Cases timed through generate_prediction.")
+    parser.add_argument("--assign-batch", type=int, default=500, help="Case ids per assign request.")
+    parser.add_argument("--assign-calls", type=int, default=5, help="Assign requests to time.")
+    parser.add_argument("--repeat", type=int, default=5, help="Calls per list endpoint.")
+    parser.add_argument("--output", default="benchmark-report.json")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in (int(s) for s in args.sizes.split(",")):
+            database_uri = args.db or "sqlite:///" + os.path.join(workdir, f"bench-{size}.db")
+            print(f"Benchmarking {size} cases on {database_uri.split('@')[-1]} ...", flush=True)
+            results.append(run_size(database_uri, size, workdir, args))
+
+    report = {
+        "generated_at": datetime.utcnow().isoformat(timespec="seconds"),
+        "database": (args.db or "sqlite").split("://")[0],
+        "results": results
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    for result in results:
+        print(f"\n{result['size']} cases")
+        for name, stats in result.items():
+            if isinstance(stats, dict) and "p50_ms" in stats:
+                print(
+                    f"  {name:40} {stats['throughput_per_second'] or 0:>12.1f}/s "
+                    f"p50 {stats['p50_ms']:>9.2f}ms p99 {stats['p99_ms']:>9.2f}ms "
+                    f"{stats['sql_statements']:>7} stmts"
+                )
+    print(f"\nReport written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
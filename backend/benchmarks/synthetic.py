@@ -0,0 +1,161 @@
+"""Synthetic tenants, case files and case activity for the benchmarks."""
+from datetime import date, datetime, timedelta
+import numpy as np
+import pandas as pd
+from sqlalchemy import insert
+from app import db
+from app.services.recovery_rate_service import rebuild_recovery_aggregates
+from app.services.case_counter_service import reconcile_status_counts
+from app.models.all_models import (
+    Organization,
+    User,
+    DebtCase,
+    CaseAssignment,
+    CaseEscalation,
+    CaseClosure,
+    SLADefinition,
+    CaseSLATracking
+)
+
+
+def seed_organizations(prefix, enterprises=1, dcas=3):
+    """Create enterprises and DCAs with one user each.
+
+    Returns ``(enterprise_users, dca_users)`` as lists of ``User``.
+    """
+    def create(role, count):
+        users = []
+        for i in range(count):
+            org = Organization(name=f"{prefix} {role.title()} {i}", type=role)
+            db.session.add(org)
+            db.session.flush()
+
+            user = User(email=f"{prefix}-{role.lower()}{i}@bench.local", role=role, organization_id=org.id)
+            db.session.add(user)
+            users.append(user)
+        return users
+
+    enterprise_users = create("ENTERPRISE", enterprises)
+    dca_users = create("DCA", dcas)
+
+    db.session.commit()
+    return enterprise_users, dca_users
+
+
+def seed_sla_definition(max_resolution_hours=72, escalation_threshold_hours=48):
+    sla = SLADefinition.query.filter_by(active=True).first()
+    if not sla:
+        sla = SLADefinition(
+            name="Benchmark SLA",
+            max_resolution_hours=max_resolution_hours,
+            escalation_threshold_hours=escalation_threshold_hours,
+            active=True
+        )
+        db.session.add(sla)
+        db.session.commit()
+    return sla
+
+
+def cases_frame(n, prefix, seed=0):
+    """``n`` upload rows in the format ``upload_cases`` accepts."""
+    rng = np.random.default_rng(seed)
+    ids = np.arange(n)
+    due_dates = pd.Timestamp(date.today()) - pd.to_timedelta(rng.integers(-15, 400, n), unit="D")
+
+    return pd.DataFrame({
+        "tracking_number": [f"{prefix}-{i:09d}" for i in ids],
+        "customer_name": [f"Customer {i % 50000}" for i in ids],
+        "amount_due": np.round(rng.lognormal(8, 1.2, n), 2),
+        "due_date": due_dates.strftime("%Y-%m-%d")
+    })
+
+
+def write_cases_file(path, n, prefix, seed=0):
+    """Write ``n`` synthetic cases to ``path`` (``.csv`` or ``.xlsx``)."""
+    df = cases_frame(n, prefix, seed)
+    if str(path).endswith(".csv"):
+        df.to_csv(path, index=False)
+    else:
+        df.to_excel(path, index=False)
+    return path
+
+
+def _batches(ids, size=5000):
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+def seed_activity(enterprise_id, dca_ids, user_id, sla_definition_id, seed=0,
+                  assigned=0.6, escalated=0.1, closed=0.15):
+    """Assign, escalate and close fractions of an enterprise's cases.
+
+    Every assigned case also gets a RUNNING SLA started up to a week ago,
+    so part of them is already past a 72h deadline. Rows are written with
+    bulk INSERTs and the recovery rate aggregates are rebuilt afterwards;
+    the counts are returned.
+    """
+    rng = np.random.default_rng(seed)
+    case_ids = np.array(db.session.scalars(
+        db.select(DebtCase.id).where(DebtCase.enterprise_id == enterprise_id)
+    ).all())
+    rng.shuffle(case_ids)
+
+    n_assigned = int(len(case_ids) * assigned)
+    n_escalated = int(n_assigned * escalated)
+    n_closed = int(len(case_ids) * closed)
+
+    assigned_ids = case_ids[:n_assigned].tolist()
+    closed_ids = case_ids[len(case_ids) - n_closed:].tolist()
+    sla_definition = db.session.get(SLADefinition, sla_definition_id)
+    now = datetime.utcnow()
+    started = [now - timedelta(hours=int(h)) for h in rng.integers(0, 168, n_assigned)]
+
+    if assigned_ids:
+        db.session.execute(insert(CaseAssignment), [
+            {"case_id": case_id, "dca_id": int(dca_id), "assigned_by": user_id, "assigned_at": at}
+            for case_id, dca_id, at in zip(assigned_ids, rng.choice(dca_ids, n_assigned), started)
+        ])
+        db.session.execute(insert(CaseSLATracking), [
+            {"case_id": case_id, "sla_definition_id": sla_definition_id, "started_at": at,
+             "due_at": at + timedelta(hours=sla_definition.max_resolution_hours),
+             "warn_at": at + timedelta(hours=sla_definition.escalation_threshold_hours),
+             "status": "RUNNING"}
+            for case_id, at in zip(assigned_ids, started)
+        ])
+        for batch in _batches(assigned_ids):
+            db.session.execute(
+                db.update(DebtCase).where(DebtCase.id.in_(batch)).values(status="PENDING")
+            )
+
+    if n_escalated:
+        db.session.execute(insert(CaseEscalation), [
+            {"case_id": case_id, "reason": "Customer unreachable", "status": "PENDING", "requested_at": now}
+            for case_id in assigned_ids[:n_escalated]
+        ])
+
+    if closed_ids:
+        amounts = {}
+        for batch in _batches(closed_ids):
+            amounts.update(db.session.execute(
+                db.select(DebtCase.id, DebtCase.amount_due).where(DebtCase.id.in_(batch))
+            ).all())
+        db.session.execute(insert(CaseClosure), [
+            {
+                "case_id": case_id,
+                "recovered_amount": round(amounts[case_id] * share, 2),
+                "closure_reason": "PAID",
+                "closed_by": user_id,
+                "closed_at": now
+            }
+            for case_id, share in zip(closed_ids, rng.uniform(0, 1, n_closed))
+        ])
+        for batch in _batches(closed_ids):
+            db.session.execute(
+                db.update(DebtCase).where(DebtCase.id.in_(batch)).values(status="CLOSED", closed_at=now)
+            )
+
+    db.session.commit()
+    rebuild_recovery_aggregates()
+    # the bulk status updates above bypass the counters
+    reconcile_status_counts()
+    return {"assigned": n_assigned, "escalated": n_escalated, "closed": n_closed}
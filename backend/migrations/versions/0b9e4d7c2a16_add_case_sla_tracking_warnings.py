@@ -0,0 +1,57 @@
+"""add case_sla_tracking warn_at and warned_at
+
+Revision ID: 0b9e4d7c2a16
+Revises: f2c7a9d04b3e
+Create Date: 2026-10-18 20:07:52.318844
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0b9e4d7c2a16'
+down_revision = 'f2c7a9d04b3e'
+branch_labels = None
+depends_on = None
+
+# warn_at = started_at + escalation_threshold_hours of the SLA's definition
+BACKFILL = {
+    "postgresql": """
+UPDATE case_sla_tracking t
+SET warn_at = t.started_at + make_interval(hours => d.escalation_threshold_hours)
+FROM sla_definitions d
+WHERE d.id = t.sla_definition_id
+""",
+    "sqlite": """
+UPDATE case_sla_tracking
+SET warn_at = (
+    SELECT strftime('%Y-%m-%d %H:%M:%f', case_sla_tracking.started_at, printf('%+d hours', d.escalation_threshold_hours))
+    FROM sla_definitions d
+    WHERE d.id = case_sla_tracking.sla_definition_id
+      AND d.escalation_threshold_hours IS NOT NULL
+)
+"""
+}
+
+
+def upgrade():
+    with op.batch_alter_table('case_sla_tracking', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('warn_at', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('warned_at', sa.DateTime(), nullable=True))
+
+    op.execute(BACKFILL[op.get_bind().dialect.name])
+
+    with op.batch_alter_table('case_sla_tracking', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_case_sla_tracking_unwarned_warn_at', ['warn_at'], unique=False,
+            postgresql_where=sa.text("status = 'RUNNING' AND warned_at IS NULL"),
+            sqlite_where=sa.text("status = 'RUNNING' AND warned_at IS NULL")
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('case_sla_tracking', schema=None) as batch_op:
+        batch_op.drop_index('ix_case_sla_tracking_unwarned_warn_at')
+        batch_op.drop_column('warned_at')
+        batch_op.drop_column('warn_at')
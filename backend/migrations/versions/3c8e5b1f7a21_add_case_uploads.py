@@ -0,0 +1,43 @@
+"""add case_uploads
+
+Revision ID: 3c8e5b1f7a21
+Revises: e11562432d16
+Create Date: 2026-10-18 10:12:31.114205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c8e5b1f7a21'
+down_revision = 'e11562432d16'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('case_uploads',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('enterprise_id', sa.Integer(), nullable=False),
+    sa.Column('uploaded_by', sa.Integer(), nullable=True),
+    sa.Column('filename', sa.String(length=255), nullable=True),
+    sa.Column('file_sha256', sa.String(length=64), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('chunk_size', sa.Integer(), nullable=False),
+    sa.Column('chunks_committed', sa.Integer(), nullable=False),
+    sa.Column('rows_processed', sa.Integer(), nullable=False),
+    sa.Column('rows_created', sa.Integer(), nullable=False),
+    sa.Column('rows_skipped', sa.Integer(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['enterprise_id'], ['organizations.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['uploaded_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('case_uploads')
@@ -0,0 +1,28 @@
+"""add debt_cases listing indexes
+
+Revision ID: 5e0b7d3a9c42
+Revises: c4a9e2f17d60
+Create Date: 2026-10-18 16:05:38.912044
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e0b7d3a9c42'
+down_revision = 'c4a9e2f17d60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('debt_cases', schema=None) as batch_op:
+        batch_op.create_index('ix_debt_cases_enterprise_id_id', ['enterprise_id', 'id'], unique=False)
+        batch_op.create_index('ix_debt_cases_enterprise_id_amount_due', ['enterprise_id', 'amount_due', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('debt_cases', schema=None) as batch_op:
+        batch_op.drop_index('ix_debt_cases_enterprise_id_amount_due')
+        batch_op.drop_index('ix_debt_cases_enterprise_id_id')
@@ -0,0 +1,26 @@
+"""add case_sla_tracking case index
+
+Revision ID: 7d3c5f1e9a08
+Revises: 0b9e4d7c2a16
+Create Date: 2026-10-18 20:41:09.552731
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d3c5f1e9a08'
+down_revision = '0b9e4d7c2a16'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('case_sla_tracking', schema=None) as batch_op:
+        batch_op.create_index('ix_case_sla_tracking_case_id_id', ['case_id', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('case_sla_tracking', schema=None) as batch_op:
+        batch_op.drop_index('ix_case_sla_tracking_case_id_id')
@@ -0,0 +1,26 @@
+"""add case_uploads.stored_path
+
+Revision ID: 8d2f41c6e0b3
+Revises: 3c8e5b1f7a21
+Create Date: 2026-10-18 11:02:47.530918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d2f41c6e0b3'
+down_revision = '3c8e5b1f7a21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('case_uploads', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('stored_path', sa.String(length=500), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('case_uploads', schema=None) as batch_op:
+        batch_op.drop_column('stored_path')
@@ -0,0 +1,46 @@
+"""add debt_cases priority_sort and sort indexes
+
+Revision ID: 9a4e2c6b1d73
+Revises: 7d3c5f1e9a08
+Create Date: 2026-10-18 21:34:15.804217
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a4e2c6b1d73'
+down_revision = '7d3c5f1e9a08'
+branch_labels = None
+depends_on = None
+
+BACKFILL = """
+UPDATE debt_cases
+SET priority_sort = (
+    SELECT p.priority_score FROM ai_model_predictions p WHERE p.case_id = debt_cases.id
+)
+WHERE EXISTS (SELECT 1 FROM ai_model_predictions p WHERE p.case_id = debt_cases.id)
+"""
+
+
+def upgrade():
+    with op.batch_alter_table('debt_cases', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('priority_sort', sa.Float(), server_default='-1.0', nullable=False))
+
+    op.execute(BACKFILL)
+
+    with op.batch_alter_table('debt_cases', schema=None) as batch_op:
+        batch_op.create_index('ix_debt_cases_enterprise_id_priority_sort', ['enterprise_id', 'priority_sort', 'id'], unique=False)
+        batch_op.create_index(
+            'ix_debt_cases_enterprise_id_aging_sort',
+            ['enterprise_id', sa.text('coalesce(aging_days, -2147483648)'), 'id'],
+            unique=False
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('debt_cases', schema=None) as batch_op:
+        batch_op.drop_index('ix_debt_cases_enterprise_id_aging_sort')
+        batch_op.drop_index('ix_debt_cases_enterprise_id_priority_sort')
+        batch_op.drop_column('priority_sort')
@@ -0,0 +1,26 @@
+"""add case_assignments dca index
+
+Revision ID: a3f6c81d2e95
+Revises: 5e0b7d3a9c42
+Create Date: 2026-10-18 16:48:12.377630
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3f6c81d2e95'
+down_revision = '5e0b7d3a9c42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('case_assignments', schema=None) as batch_op:
+        batch_op.create_index('ix_case_assignments_dca_id_case_id', ['dca_id', 'case_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('case_assignments', schema=None) as batch_op:
+        batch_op.drop_index('ix_case_assignments_dca_id_case_id')
@@ -0,0 +1,53 @@
+"""add recovery_rate_aggregates
+
+Revision ID: b71e09d4c5a8
+Revises: 8d2f41c6e0b3
+Create Date: 2026-10-18 12:20:05.671342
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b71e09d4c5a8'
+down_revision = '8d2f41c6e0b3'
+branch_labels = None
+depends_on = None
+
+# Same sums as recovery_rate_service.compute_recovery_aggregates;
+# enterprise_id 0 is the global row.
+BACKFILL = """
+INSERT INTO recovery_rate_aggregates
+    (enterprise_id, closure_count, recovered_total, due_total, ratio_total, updated_at)
+SELECT {scope}, COUNT(cc.id), SUM(cc.recovered_amount), SUM(d.amount_due),
+       SUM(cc.recovered_amount / d.amount_due), CURRENT_TIMESTAMP
+FROM case_closures cc
+JOIN debt_cases d ON d.id = cc.case_id
+WHERE cc.recovered_amount IS NOT NULL AND d.amount_due <> 0 {where}
+{group_by}
+HAVING COUNT(cc.id) > 0
+"""
+
+
+def upgrade():
+    op.create_table('recovery_rate_aggregates',
+    sa.Column('enterprise_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('closure_count', sa.Integer(), nullable=False),
+    sa.Column('recovered_total', sa.Float(), nullable=False),
+    sa.Column('due_total', sa.Float(), nullable=False),
+    sa.Column('ratio_total', sa.Float(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('enterprise_id')
+    )
+
+    op.execute(BACKFILL.format(scope="0", where="", group_by=""))
+    op.execute(BACKFILL.format(
+        scope="d.enterprise_id",
+        where="AND d.enterprise_id IS NOT NULL",
+        group_by="GROUP BY d.enterprise_id"
+    ))
+
+
+def downgrade():
+    op.drop_table('recovery_rate_aggregates')
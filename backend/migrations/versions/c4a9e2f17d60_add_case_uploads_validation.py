@@ -0,0 +1,28 @@
+"""add case_uploads validation columns
+
+Revision ID: c4a9e2f17d60
+Revises: b71e09d4c5a8
+Create Date: 2026-10-18 15:20:11.204517
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4a9e2f17d60'
+down_revision = 'b71e09d4c5a8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('case_uploads', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('rows_invalid', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('validation_errors', sa.JSON(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('case_uploads', schema=None) as batch_op:
+        batch_op.drop_column('validation_errors')
+        batch_op.drop_column('rows_invalid')
@@ -0,0 +1,42 @@
+"""add case_status_counts
+
+Revision ID: e8b25a0c4f17
+Revises: a3f6c81d2e95
+Create Date: 2026-10-18 18:02:44.158203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8b25a0c4f17'
+down_revision = 'a3f6c81d2e95'
+branch_labels = None
+depends_on = None
+
+# Same counts as case_counter_service.compute_status_counts
+BACKFILL = """
+INSERT INTO case_status_counts (enterprise_id, status, case_count, updated_at)
+SELECT enterprise_id, COALESCE(status, ''), COUNT(*), CURRENT_TIMESTAMP
+FROM debt_cases
+WHERE enterprise_id IS NOT NULL
+GROUP BY enterprise_id, COALESCE(status, '')
+"""
+
+
+def upgrade():
+    op.create_table('case_status_counts',
+    sa.Column('enterprise_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('case_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['enterprise_id'], ['organizations.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('enterprise_id', 'status')
+    )
+
+    op.execute(BACKFILL)
+
+
+def downgrade():
+    op.drop_table('case_status_counts')
@@ -0,0 +1,54 @@
+"""add case_sla_tracking due_at
+
+Revision ID: f2c7a9d04b3e
+Revises: e8b25a0c4f17
+Create Date: 2026-10-18 19:21:37.604118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2c7a9d04b3e'
+down_revision = 'e8b25a0c4f17'
+branch_labels = None
+depends_on = None
+
+# due_at = started_at + max_resolution_hours of the SLA's definition
+BACKFILL = {
+    "postgresql": """
+UPDATE case_sla_tracking t
+SET due_at = t.started_at + make_interval(hours => d.max_resolution_hours)
+FROM sla_definitions d
+WHERE d.id = t.sla_definition_id
+""",
+    "sqlite": """
+UPDATE case_sla_tracking
+SET due_at = (
+    SELECT strftime('%Y-%m-%d %H:%M:%f', case_sla_tracking.started_at, printf('%+d hours', d.max_resolution_hours))
+    FROM sla_definitions d
+    WHERE d.id = case_sla_tracking.sla_definition_id
+)
+"""
+}
+
+
+def upgrade():
+    with op.batch_alter_table('case_sla_tracking', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('due_at', sa.DateTime(), nullable=True))
+
+    op.execute(BACKFILL[op.get_bind().dialect.name])
+
+    with op.batch_alter_table('case_sla_tracking', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_case_sla_tracking_running_due_at', ['due_at'], unique=False,
+            postgresql_where=sa.text("status = 'RUNNING'"),
+            sqlite_where=sa.text("status = 'RUNNING'")
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('case_sla_tracking', schema=None) as batch_op:
+        batch_op.drop_index('ix_case_sla_tracking_running_due_at')
+        batch_op.drop_column('due_at')
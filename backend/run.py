@@ -1,7 +1,12 @@
+import os
 from app import create_app
+from app.jobs.sla_daemon import start_sla_daemon_thread
 
 # This MUST be named 'app' for the flask command to find it automatically
 app = create_app()
 
 if __name__ == "__main__":
-    app.run(debug=True)
\ No newline at end of file
+    # only the reloader's child process serves requests
+    if app.config["SLA_DAEMON_IN_PROCESS"] and os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_sla_daemon_thread(app)
+    app.run(debug=True)
@@ -0,0 +1,66 @@
+import pytest
+from app import create_app, db
+from app.models.all_models import Organization, User, SLADefinition
+from benchmarks.run import StatementCounter
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app({
+        "TESTING": True,
+        "SECRET_KEY": "test",
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'test.db'}",
+        "UPLOAD_FOLDER": str(tmp_path / "uploads"),
+        "EXPORT_FOLDER": str(tmp_path / "exports"),
+        "OVERVIEW_CACHE_TTL": 0,
+        "CHART_RENDER_WORKERS": 0
+    })
+
+    with app.app_context():
+        db.create_all()
+        enterprise = Organization(name="Enterprise", type="ENTERPRISE")
+        dca = Organization(name="DCA", type="DCA")
+        db.session.add_all([enterprise, dca])
+        db.session.flush()
+        db.session.add_all([
+            User(email="enterprise@example.com", role="ENTERPRISE", organization_id=enterprise.id),
+            User(email="dca@example.com", role="DCA", organization_id=dca.id),
+            SLADefinition(name="Standard", max_resolution_hours=72, escalation_threshold_hours=48, active=True)
+        ])
+        db.session.commit()
+
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+def _login(app, email):
+    client = app.test_client()
+    response = client.post("/api/auth/login", json={"email": email})
+    assert response.status_code == 200
+    return client
+
+
+@pytest.fixture
+def enterprise_client(app):
+    return _login(app, "enterprise@example.com")
+
+
+@pytest.fixture
+def dca_client(app):
+    return _login(app, "dca@example.com")
+
+
+@pytest.fixture
+def dca_id(app):
+    with app.app_context():
+        return Organization.query.filter_by(type="DCA").one().id
+
+
+@pytest.fixture
+def count_statements(app):
+    with app.app_context():
+        engine = db.engine
+    return lambda: StatementCounter(engine)
@@ -0,0 +1,21 @@
+import io
+from datetime import date, timedelta
+
+
+def cases_csv(count, start=0):
+    lines = ["tracking_number,customer_name,amount_due,due_date"]
+    for i in range(start, start + count):
+        due_date = date.today() - timedelta(days=i % 120)
+        lines.append(f"TRK{i:08d},Customer {i},{100 + i * 7},{due_date.isoformat()}")
+    return ("\n".join(lines) + "\n").encode()
+
+
+def upload_cases(client, count, start=0):
+    """Upload ``count`` cases synchronously, returns the upload response JSON."""
+    response = client.post(
+        "/api/enterprise/cases/upload?mode=sync",
+        data={"file": (io.BytesIO(cases_csv(count, start)), "cases.csv")},
+        content_type="multipart/form-data"
+    )
+    assert response.status_code in (200, 201), response.get_json()
+    return response.get_json()
@@ -0,0 +1,48 @@
+from sqlalchemy import func
+from app import db
+from app.models.all_models import DebtCase
+from app.services.case_counter_service import reconcile_status_counts, stored_status_counts
+from tests.helpers import upload_cases
+
+
+def _actual_status_counts(enterprise_id):
+    return dict(db.session.execute(
+        db.select(func.coalesce(DebtCase.status, ""), func.count())
+        .where(DebtCase.enterprise_id == enterprise_id)
+        .group_by(func.coalesce(DebtCase.status, ""))
+    ).all())
+
+
+def _post_ok(client, url, **json):
+    response = client.post(url, json=json)
+    assert response.status_code == 200, response.get_json()
+
+
+def test_status_counters_follow_the_transitions(app, enterprise_client, dca_client, dca_id):
+    upload_cases(enterprise_client, 10)
+    with app.app_context():
+        enterprise_id, = db.session.scalars(db.select(DebtCase.enterprise_id).distinct())
+        ids = sorted(db.session.scalars(db.select(DebtCase.id)))
+
+    _post_ok(enterprise_client, "/api/enterprise/assign", case_ids=ids[:8], dca_id=dca_id)
+    # already assigned cases are left alone
+    _post_ok(enterprise_client, "/api/enterprise/assign", case_ids=ids[:2], dca_id=dca_id)
+
+    _post_ok(dca_client, f"/api/dca/cases/{ids[0]}/update-status", status="Paid")
+    _post_ok(dca_client, f"/api/dca/cases/{ids[1]}/update-status", status="Escalate")
+    _post_ok(enterprise_client, f"/api/enterprise/cases/{ids[2]}/close", reason="PAID", amount=50)
+    _post_ok(enterprise_client, f"/api/enterprise/cases/{ids[3]}/close", reason="DISPUTE")
+    _post_ok(enterprise_client, f"/api/enterprise/cases/{ids[8]}/close", reason="WRITE_OFF")
+
+    for case_id in ids[4:6]:
+        _post_ok(dca_client, f"/api/dca/cases/{case_id}/request-escalation", reason="No contact")
+    _post_ok(enterprise_client, "/api/enterprise/escalations/approve", case_id=ids[4])
+    _post_ok(enterprise_client, "/api/enterprise/escalations/reject", case_id=ids[5])
+
+    with app.app_context():
+        actual = _actual_status_counts(enterprise_id)
+        assert actual == {
+            "NEW": 1, "PENDING": 3, "Paid": 1, "ESCALATED": 2, "CLOSED": 2, "DISPUTED": 1
+        }
+        assert stored_status_counts(enterprise_id) == actual
+        assert reconcile_status_counts(dry_run=True) == {}
@@ -0,0 +1,27 @@
+import csv
+import io
+import os
+from tests.helpers import upload_cases
+
+
+def test_csv_export_leaves_no_file_behind(app, enterprise_client):
+    upload_cases(enterprise_client, 20)
+
+    # the WSGI server closes the response once it is sent
+    with enterprise_client.get("/api/enterprise/cases/export?format=csv") as response:
+        assert response.status_code == 200
+        rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert len(rows) == 20
+
+    assert os.listdir(app.config["EXPORT_FOLDER"]) == []
+
+
+def test_unread_export_is_removed(app, enterprise_client):
+    upload_cases(enterprise_client, 5)
+
+    # the client never pulls a chunk
+    response = enterprise_client.get("/api/enterprise/cases/export?format=csv", buffered=False)
+    assert response.status_code == 200
+    response.close()
+
+    assert os.listdir(app.config["EXPORT_FOLDER"]) == []
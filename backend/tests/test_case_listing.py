@@ -0,0 +1,43 @@
+from app.utils.pagination import encode_cursor
+from tests.helpers import upload_cases
+
+
+def _listing_statements(client, count_statements):
+    with count_statements() as counter:
+        response = client.get("/api/enterprise/cases?limit=500")
+    assert response.status_code == 200
+    return counter.count, len(response.get_json()["items"])
+
+
+def test_case_listing_statement_count_is_constant(enterprise_client, count_statements):
+    upload_cases(enterprise_client, 10)
+    small, listed = _listing_statements(enterprise_client, count_statements)
+    assert listed == 10
+
+    upload_cases(enterprise_client, 290, start=10)
+    large, listed = _listing_statements(enterprise_client, count_statements)
+    assert listed == 300
+
+    assert small == large
+
+
+def test_forged_cursors_are_rejected(enterprise_client):
+    upload_cases(enterprise_client, 3)
+    response = enterprise_client.get("/api/enterprise/cases?limit=2&sort=amount_due&order=asc")
+    next_cursor = response.get_json()["next_cursor"]
+    assert enterprise_client.get(f"/api/enterprise/cases?limit=2&sort=amount_due&order=asc&cursor={next_cursor}").status_code == 200
+
+    forged = (
+        ["amount_due", "asc", {"a": 1}, 1],
+        ["amount_due", "asc", 100.0, "1"],
+        ["amount_due", "asc", 100.0, True],
+        ["amount_due", "asc", [100.0], 1],
+        ["amount_due", "asc", 100.0],
+        ["amount_due", "asc", 100.0, 1, 2]
+    )
+    for values in forged:
+        response = enterprise_client.get(
+            "/api/enterprise/cases",
+            query_string={"sort": "amount_due", "order": "asc", "cursor": encode_cursor(values)}
+        )
+        assert response.status_code == 400, values
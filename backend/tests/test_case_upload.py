@@ -0,0 +1,68 @@
+import io
+from app import db
+from app.models.case_upload import CaseUpload
+from tests.helpers import cases_csv
+
+
+def _stream_upload(client, count, **params):
+    return client.post(
+        "/api/enterprise/cases/upload",
+        query_string={"mode": "stream", **params},
+        data={"file": (io.BytesIO(cases_csv(count)), "cases.csv")},
+        content_type="multipart/form-data"
+    )
+
+
+def _set_upload(app, upload_id, **values):
+    with app.app_context():
+        upload = db.session.get(CaseUpload, upload_id)
+        for name, value in values.items():
+            setattr(upload, name, value)
+        db.session.commit()
+
+
+def test_stream_resume_claims_failed_uploads_once(app, enterprise_client):
+    response = _stream_upload(enterprise_client, 10, chunk_size=4)
+    assert response.status_code == 200
+    upload_id = response.get_json()["upload_id"]
+
+    # completed uploads are not run again
+    assert _stream_upload(enterprise_client, 10, resume=upload_id).status_code == 409
+
+    _set_upload(app, upload_id, status="FAILED")
+    response = _stream_upload(enterprise_client, 10, resume=upload_id)
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "COMPLETED"
+
+    assert _stream_upload(enterprise_client, 10, resume=upload_id).status_code == 409
+
+
+def test_stream_resume_refuses_running_and_background_uploads(app, enterprise_client):
+    upload_id = _stream_upload(enterprise_client, 10).get_json()["upload_id"]
+
+    # a run still making progress
+    _set_upload(app, upload_id, status="RUNNING")
+    assert _stream_upload(enterprise_client, 10, resume=upload_id).status_code == 409
+
+    # a background job, even a failed one, keeps its stored file for /resume
+    _set_upload(app, upload_id, status="FAILED", stored_path="/tmp/1-cases.csv")
+    assert _stream_upload(enterprise_client, 10, resume=upload_id).status_code == 409
+
+    with app.app_context():
+        assert db.session.get(CaseUpload, upload_id).status == "FAILED"
+
+
+def test_invalid_chunk_size_is_rejected_before_the_upload_row(app, enterprise_client):
+    for chunk_size in ("-5", "0", "abc", "1.5"):
+        assert _stream_upload(enterprise_client, 3, chunk_size=chunk_size).status_code == 400
+
+    with app.app_context():
+        assert CaseUpload.query.count() == 0
+
+
+def test_chunk_size_is_capped(app, enterprise_client):
+    app.config["MAX_UPLOAD_CHUNK_SIZE"] = 2
+    response = _stream_upload(enterprise_client, 5, chunk_size=1000)
+    assert response.status_code == 200
+    assert response.get_json()["chunk_size"] == 2
+    assert response.get_json()["chunks_committed"] == 3
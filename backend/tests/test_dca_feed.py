@@ -0,0 +1,21 @@
+from tests.helpers import upload_cases
+
+
+def _feed_ids(client, **params):
+    response = client.get("/api/dca/cases", query_string={"limit": 500, **params})
+    assert response.status_code == 200
+    return {item["id"] for item in response.get_json()["items"]}
+
+
+def test_status_filter_ignores_case(enterprise_client, dca_client, dca_id):
+    upload_cases(enterprise_client, 5)
+    case_ids = sorted(c["id"] for c in enterprise_client.get("/api/enterprise/cases").get_json()["items"])
+    enterprise_client.post("/api/enterprise/assign", json={"case_ids": case_ids, "dca_id": dca_id})
+
+    # assignment stores "PENDING", the DCA update stores "Pending"
+    response = dca_client.post(f"/api/dca/cases/{case_ids[0]}/update-status", json={"status": "Pending"})
+    assert response.status_code == 200
+
+    assert _feed_ids(dca_client, status="PENDING") == set(case_ids)
+    assert _feed_ids(dca_client, status="pending") == set(case_ids)
+    assert _feed_ids(dca_client, status="PAID") == set()
@@ -0,0 +1,186 @@
+import json
+import queue
+import threading
+import time
+from datetime import datetime, timedelta
+import pytest
+from app import db
+from app.models.all_models import AuditLog, CaseSLATracking, DebtCase, SLADefinition
+from app.jobs.sla_breach_checker import check_sla_thresholds
+from app.jobs.sla_daemon import (
+    DUE,
+    WARN,
+    DeadlineHeap,
+    apply_sla_event,
+    run_sla_daemon,
+    sla_event_listener
+)
+from app.services.sla_service import local_sla_events, start_sla
+from tests.helpers import upload_cases
+
+T0 = datetime(2026, 1, 1)
+
+
+def at(seconds):
+    return T0 + timedelta(seconds=seconds)
+
+
+@pytest.fixture(autouse=True)
+def drained_events():
+    # the local queue is process-wide, start every test without leftovers
+    while True:
+        try:
+            local_sla_events.get_nowait()
+        except queue.Empty:
+            return
+
+
+@pytest.fixture
+def case_ids(app, enterprise_client):
+    upload_cases(enterprise_client, 4)
+    with app.app_context():
+        return sorted(db.session.scalars(db.select(DebtCase.id)))
+
+
+def start_slas(app, case_ids, started_at):
+    with app.app_context():
+        sla = SLADefinition.query.one()
+        for case_id in case_ids:
+            start_sla(case_id, sla, started_at)
+        db.session.commit()
+
+
+# ---------- DeadlineHeap ----------
+def test_load_keeps_the_soonest_timers_within_capacity():
+    timers = DeadlineHeap(capacity=3)
+    timers.load([((DUE, i), at(i)) for i in (5, 1, 4, 2, 3)], until=at(100))
+
+    assert len(timers) == 3
+    # the window ends at the last timer kept, later ones wait for the next load
+    assert timers.loaded_until == at(3)
+    assert timers.next_due() == at(1)
+    assert timers.pop_due(at(3)) == 3
+    assert len(timers) == 0 and timers.next_due() is None
+
+
+def test_push_outside_the_window_or_when_full_is_deferred():
+    timers = DeadlineHeap(capacity=2)
+    timers.load([((DUE, 1), at(10))], until=at(100))
+
+    timers.push((DUE, 2), at(200))
+    assert len(timers) == 1
+
+    timers.push((DUE, 3), at(50))
+    assert len(timers) == 2
+
+    # full: the window shrinks to the deferred timer instead of evicting
+    timers.push((DUE, 4), at(30))
+    assert len(timers) == 2
+    assert timers.loaded_until == at(30)
+
+    # timers already held can still move
+    timers.push((DUE, 3), at(20))
+    assert timers.pop_due(at(25)) == 2
+
+
+def test_discarded_and_restarted_timers_are_skipped():
+    timers = DeadlineHeap(capacity=10)
+    timers.load([((DUE, 1), at(10)), ((WARN, 1), at(5)), ((DUE, 2), at(20))], until=at(100))
+
+    timers.discard((DUE, 1))
+    timers.discard((WARN, 1))
+    timers.push((DUE, 2), at(40))
+
+    assert timers.next_due() == at(40)
+    assert timers.pop_due(at(30)) == 0
+    assert timers.pop_due(at(40)) == 1
+
+
+def test_stale_entries_are_compacted():
+    timers = DeadlineHeap(capacity=4)
+    timers.load([], until=at(10000))
+    for i in range(100):
+        timers.push((DUE, 1), at(i))
+
+    assert len(timers) == 1
+    assert len(timers._heap) <= 2 * timers.capacity + 1
+    assert timers.next_due() == at(99)
+
+
+# ---------- events ----------
+def test_committed_sla_changes_reach_the_timers(app, enterprise_client, case_ids):
+    started_at = datetime.utcnow()
+    start_slas(app, case_ids[:2], started_at)
+
+    response = enterprise_client.post(f"/api/enterprise/cases/{case_ids[0]}/close", json={"reason": "PAID"})
+    assert response.status_code == 200
+
+    with app.app_context():
+        # rolled back SLAs are never announced
+        start_sla(case_ids[2], SLADefinition.query.one(), started_at)
+        db.session.rollback()
+
+        timers = DeadlineHeap(capacity=10)
+        timers.load([], until=started_at + timedelta(days=30))
+        with sla_event_listener() as wait:
+            payloads = wait(0)
+
+    assert [json.loads(p)["event"] for p in payloads] == ["started", "started", "completed"]
+    for payload in payloads:
+        apply_sla_event(timers, payload)
+
+    # the closed case's timers are gone, the other keeps its deadline and threshold
+    assert len(timers) == 2
+    assert timers.next_due() == started_at + timedelta(hours=48)
+    assert timers.pop_due(started_at + timedelta(hours=72)) == 2
+
+
+def test_daemon_breaches_an_sla_started_while_it_sleeps(app, case_ids):
+    checks = []
+    stop = threading.Event()
+
+    def run():
+        with app.app_context():
+            run_sla_daemon(
+                horizon=60, capacity=100, stop=stop,
+                on_check=lambda breached, warned, now: checks.append((breached, warned))
+            )
+
+    daemon = threading.Thread(target=run, daemon=True)
+    daemon.start()
+    time.sleep(0.2)
+
+    # due half a second from now, only known to the daemon through its event
+    start_slas(app, case_ids[:1], datetime.utcnow() - timedelta(hours=72) + timedelta(seconds=0.5))
+
+    deadline = time.monotonic() + 5
+    while sum(breached for breached, _ in checks) < 1 and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    stop.set()
+    local_sla_events.put_nowait(json.dumps({"event": "completed", "case_id": 0}))
+    daemon.join(5)
+
+    # the escalation threshold has passed already: warned at once, breached when due
+    assert checks == [(0, 1), (1, 0)]
+    with app.app_context():
+        assert CaseSLATracking.query.one().status == "BREACHED"
+
+
+# ---------- claims ----------
+def test_breaches_and_warnings_are_claimed_once(app, case_ids):
+    now = datetime.utcnow()
+    # two past their deadline, two past their escalation threshold only
+    start_slas(app, case_ids[:2], now - timedelta(hours=80))
+    start_slas(app, case_ids[2:], now - timedelta(hours=50))
+
+    with app.app_context():
+        assert check_sla_thresholds(now) == (2, 2)
+        assert check_sla_thresholds(now) == (0, 0)
+        assert check_sla_thresholds(now + timedelta(hours=1)) == (0, 0)
+
+        actions = db.session.scalars(db.select(AuditLog.action).where(AuditLog.entity_type == "SLA")).all()
+        assert sorted(actions) == ["SLA_APPROACHING_BREACH"] * 2 + ["SLA_BREACHED"] * 2
+
+        statuses = dict(db.session.execute(db.select(CaseSLATracking.case_id, CaseSLATracking.status)).all())
+        assert [statuses[case_id] for case_id in case_ids] == ["BREACHED", "BREACHED", "RUNNING", "RUNNING"]
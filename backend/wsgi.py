@@ -0,0 +1,9 @@
+"""WSGI entry point, e.g. ``gunicorn wsgi:app``."""
+from app import create_app
+from app.jobs.sla_daemon import start_sla_daemon_thread
+
+app = create_app()
+
+# one daemon per serving process: only for single-worker deployments
+if app.config["SLA_DAEMON_IN_PROCESS"]:
+    start_sla_daemon_thread(app)